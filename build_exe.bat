@@ -32,6 +32,7 @@ python -m PyInstaller ^
   --hidden-import psutil ^
   --hidden-import wmi ^
   --hidden-import GPUtil ^
+  --hidden-import waitress ^
   launch.py
 
 if errorlevel 1 (
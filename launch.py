@@ -273,13 +273,14 @@ def open_browser(port=5000):
     webbrowser.open(f'http://localhost:{port}')
 
 def watch_for_shutdown(port=5000):
-    """Poll /api/stats — if server stops responding, exit cleanly."""
+    """Poll /api/version — if server stops responding, exit cleanly.
+    A liveness probe only: /api/stats would sample hardware and keep the GPU poller awake."""
     import urllib.request
     time.sleep(20)  # Give server plenty of time to start
     consecutive_failures = 0
     while True:
         try:
-            urllib.request.urlopen(f'http://localhost:{port}/api/stats', timeout=5)
+            urllib.request.urlopen(f'http://localhost:{port}/api/version', timeout=5)
             consecutive_failures = 0
         except Exception:
             consecutive_failures += 1
@@ -300,13 +301,14 @@ def watch_for_shutdown(port=5000):
 
 if __name__ == '__main__':
     port = 5000
-    if len(sys.argv) > 1:
+    args = [a for a in sys.argv[1:] if a != '--dev']
+    if args:
         try:
-            port = int(sys.argv[1])
+            port = int(args[0])
             if port < 1 or port > 65535:
                 raise ValueError('port out of range')
         except (ValueError, TypeError):
-            print('  Usage: python launch.py [PORT]  (default: 5000)')
+            print('  Usage: python launch.py [PORT] [--dev]  (default: 5000)')
             sys.exit(1)
 
     print("\n  ╔══════════════════════════════════════╗")
@@ -344,10 +346,10 @@ if __name__ == '__main__':
 
     try:
         pass  # _kill_existing_server already called above
-        from server import app
+        from server import run_server
         print(f"  Open browser -> http://localhost:{port}")
         print("  Press Ctrl+C or close browser tab to stop\n")
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False, threaded=True)
+        run_server(port, dev='--dev' in sys.argv)
     except Exception as _launch_exc:
         _write_crash(_launch_exc)
         print(f"\n  [ERROR] KAM Sentinel crashed: {_launch_exc}")
@@ -20,8 +20,10 @@ Environment:
                    Required for CI monitoring. Auto-available in GitHub Actions.
 """
 
-import json, os, sys, time, datetime, subprocess, argparse, re, threading, uuid
+import json, os, sys, time, datetime, subprocess, argparse, re, threading, uuid, atexit
 import urllib.request, urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -232,6 +234,7 @@ CI_KNOWN_ISSUES = {
 
 # ── Local bug helpers ──────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=256)   # a handful of distinct release strings over the daemon's life
 def _ver_tuple(v):
     try:
         return tuple(int(x) for x in str(v).strip().split('.')[:3])
@@ -239,8 +242,37 @@ def _ver_tuple(v):
         return (0, 0, 0)
 
 
+# Long-lived O_APPEND descriptors for the JSONL append logs: one os.write per
+# entry instead of makedirs + open + close each time. Opened lazily per path so
+# importing this module has no side effects; O_APPEND keeps each line atomic.
+_append_fds  = {}
+_append_lock = threading.Lock()
+
+def _close_append_fds():
+    with _append_lock:
+        for fd in _append_fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        _append_fds.clear()
+
+atexit.register(_close_append_fds)
+
+def _append_line(path, obj):
+    """Append obj as one JSON line to path via a cached O_APPEND fd."""
+    data = (json.dumps(obj) + '\n').encode('utf-8')
+    with _append_lock:
+        fd = _append_fds.get(path)
+        if fd is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            flags = (os.O_WRONLY | os.O_APPEND | os.O_CREAT
+                     | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+            fd = _append_fds[path] = os.open(path, flags, 0o644)
+        os.write(fd, data)
+
+
 def _log(bug_id, action, result, tests_passing=None):
-    os.makedirs(os.path.dirname(WATCHER_LOG), exist_ok=True)
     entry = {
         'ts': time.time(),
         'date': datetime.datetime.now().isoformat(),
@@ -249,8 +281,7 @@ def _log(bug_id, action, result, tests_passing=None):
         'result': result,
         'tests_passing': tests_passing,
     }
-    with open(WATCHER_LOG, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(entry) + '\n')
+    _append_line(WATCHER_LOG, entry)
 
 
 def _run_tests():
@@ -272,11 +303,54 @@ def _run_tests():
     return None
 
 
+# Test runs happen off the poll path: one background worker, one suite run per
+# batch of critical bugs. Bugs resolved while a run is in flight queue up for
+# the next run instead of each spawning their own 180 s subprocess.
+_test_executor = ThreadPoolExecutor(max_workers=1)
+_test_lock     = threading.Lock()
+_test_future   = None
+_test_pending  = []
+_bug_file_lock = threading.Lock()   # bug.jsonl rewrites race with the test worker
+
+
+def _run_pending_tests():
+    """Background worker: run the suite once per pending batch, stamp each bug with the result."""
+    global _test_future
+    try:
+        while True:
+            with _test_lock:
+                if not _test_pending:
+                    return
+                batch, _test_pending[:] = list(_test_pending), []
+            tests_n = _run_tests()
+            for bug_id in batch:
+                try:
+                    _update_bug_in_file(bug_id, {'tests_passing': tests_n})
+                    _log(bug_id, 'tests_run', f'post-resolve test run: {tests_n} passing', tests_n)
+                except Exception as exc:
+                    print(f'[Eve] Could not record test run for {bug_id}: {exc}', flush=True)
+    finally:
+        # Always disarm, and re-arm if work arrived, so one bad batch can't stall every later run
+        with _test_lock:
+            _test_future = _test_executor.submit(_run_pending_tests) if _test_pending else None
+
+
+def _schedule_tests(bug_ids):
+    """Queue bug_ids for a post-resolve test run; never blocks the poll loop."""
+    global _test_future
+    if not bug_ids:
+        return
+    with _test_lock:
+        _test_pending.extend(bug_ids)
+        if _test_future is None:
+            _test_future = _test_executor.submit(_run_pending_tests)
+
+
 def _load_open_bugs():
     bugs = []
     if not os.path.exists(FEEDBACK_BUG_FILE):
         return bugs
-    with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
+    with _bug_file_lock, open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -293,35 +367,34 @@ def _load_open_bugs():
 def _rewrite_bug(bug_id, status, fix_summary, tests_passing=None):
     if not os.path.exists(FEEDBACK_BUG_FILE):
         return
-    lines_out = []
-    with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
-        for raw in f:
-            raw = raw.rstrip('\n')
-            if not raw.strip():
-                continue
-            try:
-                b = json.loads(raw)
-                if b.get('id') == bug_id:
-                    b['status'] = status
-                    b['resolved_at'] = datetime.datetime.now().isoformat()
-                    b['fix_summary'] = fix_summary
-                    if tests_passing is not None:
-                        b['tests_passing'] = tests_passing
-                    raw = json.dumps(b)
-            except Exception:
-                pass
-            lines_out.append(raw)
-    with open(FEEDBACK_BUG_FILE, 'w', encoding='utf-8') as f:
-        for line in lines_out:
-            f.write(line + '\n')
+    with _bug_file_lock:
+        lines_out = []
+        with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
+            for raw in f:
+                raw = raw.rstrip('\n')
+                if not raw.strip():
+                    continue
+                try:
+                    b = json.loads(raw)
+                    if b.get('id') == bug_id:
+                        b['status'] = status
+                        b['resolved_at'] = datetime.datetime.now().isoformat()
+                        b['fix_summary'] = fix_summary
+                        if tests_passing is not None:
+                            b['tests_passing'] = tests_passing
+                        raw = json.dumps(b)
+                except Exception:
+                    pass
+                lines_out.append(raw)
+        with open(FEEDBACK_BUG_FILE, 'w', encoding='utf-8') as f:
+            for line in lines_out:
+                f.write(line + '\n')
 
 
 def _escalate(bug):
-    os.makedirs(BUGS_DIR, exist_ok=True)
     bug = dict(bug)
     bug['escalated_at'] = datetime.datetime.now().isoformat()
-    with open(ESCALATED_FILE, 'a', encoding='utf-8') as f:
-        f.write(json.dumps(bug) + '\n')
+    _append_line(ESCALATED_FILE, bug)
 
 
 def _match(bug):
@@ -349,7 +422,7 @@ def _find_open_bug(trigger, os_name=None, version=None):
     """Return existing open/in_progress bug dict matching trigger + os + version, or None."""
     if not os.path.exists(FEEDBACK_BUG_FILE):
         return None
-    with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
+    with _bug_file_lock, open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -374,23 +447,24 @@ def _update_bug_in_file(bug_id, updates):
     """Apply updates dict to the bug with matching bug_id in FEEDBACK_BUG_FILE."""
     if not os.path.exists(FEEDBACK_BUG_FILE):
         return
-    lines_out = []
-    with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
-        for raw in f:
-            raw = raw.rstrip('\n')
-            if not raw.strip():
-                continue
-            try:
-                b = json.loads(raw)
-                if b.get('bug_id') == bug_id or b.get('id') == bug_id:
-                    b.update(updates)
-                    raw = json.dumps(b)
-            except Exception:
-                pass
-            lines_out.append(raw)
-    with open(FEEDBACK_BUG_FILE, 'w', encoding='utf-8') as f:
-        for line in lines_out:
-            f.write(line + '\n')
+    with _bug_file_lock:
+        lines_out = []
+        with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
+            for raw in f:
+                raw = raw.rstrip('\n')
+                if not raw.strip():
+                    continue
+                try:
+                    b = json.loads(raw)
+                    if b.get('bug_id') == bug_id or b.get('id') == bug_id:
+                        b.update(updates)
+                        raw = json.dumps(b)
+                except Exception:
+                    pass
+                lines_out.append(raw)
+        with open(FEEDBACK_BUG_FILE, 'w', encoding='utf-8') as f:
+            for line in lines_out:
+                f.write(line + '\n')
 
 
 def _file_or_update_bug(trigger, attempted_fix, result, lhm_state=None, version=None, os_name=None):
@@ -492,7 +566,7 @@ def _file_or_update_bug(trigger, attempted_fix, result, lhm_state=None, version=
             'last_seen':      now_str,
             'message':        f'Auto-filed by Eve: {trigger} — {result}',
         }
-        with open(FEEDBACK_BUG_FILE, 'a', encoding='utf-8') as f:
+        with _bug_file_lock, open(FEEDBACK_BUG_FILE, 'a', encoding='utf-8') as f:
             f.write(json.dumps(bug) + '\n')
         _log(bid, 'filed', f'new bug: trigger={trigger} priority={priority}')
         return bug
@@ -660,7 +734,7 @@ def _lhm_fix_attempt():
 
 def poll_cycle(seen_ids):
     bugs = _load_open_bugs()
-    fixed, escalated = [], []
+    fixed, escalated, needs_tests = [], [], []
 
     # Speak once if there are new bugs to process
     new_bugs = [b for b in bugs if b.get('id', 'UNKNOWN') not in seen_ids]
@@ -680,19 +754,21 @@ def poll_cycle(seen_ids):
             action = issue.get('action', 'resolve')
 
             if action == 'resolve':
-                tests_n = _run_tests() if priority == 'critical' else None
-                _rewrite_bug(bug_id, 'resolved', issue['fix_summary'], tests_n)
-                _log(bug_id, 'auto_resolved', issue['fix_summary'], tests_n)
+                _rewrite_bug(bug_id, 'resolved', issue['fix_summary'])
+                _log(bug_id, 'auto_resolved', issue['fix_summary'])
+                if priority == 'critical':
+                    needs_tests.append(bug_id)
                 fixed.append(bug_id)
                 seen_ids.add(bug_id)
 
             elif action == 'resolve_if_old':
-                bug_ver  = _ver_tuple(bug.get('version', '0.0.0'))
+                bug_ver  = _ver_tuple(str(bug.get('version', '0.0.0')))
                 fixed_in = [_ver_tuple(v) for v in issue.get('versions_fixed', [])]
                 if fixed_in and bug_ver < min(fixed_in):
-                    tests_n = _run_tests() if priority == 'critical' else None
-                    _rewrite_bug(bug_id, 'resolved', issue['fix_summary'], tests_n)
-                    _log(bug_id, 'auto_resolved', issue['fix_summary'], tests_n)
+                    _rewrite_bug(bug_id, 'resolved', issue['fix_summary'])
+                    _log(bug_id, 'auto_resolved', issue['fix_summary'])
+                    if priority == 'critical':
+                        needs_tests.append(bug_id)
                     fixed.append(bug_id)
                     seen_ids.add(bug_id)
                 else:
@@ -710,6 +786,8 @@ def poll_cycle(seen_ids):
             escalated.append(bug_id)
             seen_ids.add(bug_id)
 
+    _schedule_tests(needs_tests)
+
     if fixed:
         eve_speak("Fixed it! Clean build, no issues. You are so welcome!")
     if escalated:
@@ -1142,7 +1220,7 @@ def daily_summary():
     fixed, escalated, still_open = [], [], []
 
     if os.path.exists(FEEDBACK_BUG_FILE):
-        with open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
+        with _bug_file_lock, open(FEEDBACK_BUG_FILE, encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
                 if not line:
@@ -1243,6 +1321,11 @@ def daily_summary():
 
 # ── Entry point ────────────────────────────────────────────────────────────────
 
+def _summary_deadline(day):
+    """Epoch seconds for 23:55 local time on `day` (a datetime.date)."""
+    return datetime.datetime.combine(day, datetime.time(23, 55)).timestamp()
+
+
 def main():
     parser = argparse.ArgumentParser(description='KAM Sentinel BugWatcher daemon')
     parser.add_argument('--once', action='store_true',
@@ -1276,8 +1359,10 @@ def main():
 
     seen_ids     = set()
     seen_run_ids = set()
-    last_daily   = None
     last_ci_poll = 0.0  # force immediate first CI poll
+    # Today's 23:55 even if already past it — starting inside the window still
+    # produces today's summary, same as the old hour/minute check.
+    next_summary = _summary_deadline(datetime.date.today())
 
     while True:
         # ── Local bug poll ────────────────────────────────────────────────────
@@ -1303,24 +1388,29 @@ def main():
             last_ci_poll = time.time()
 
         # ── Daily summary at 23:55–23:59 ──────────────────────────────────────
-        now   = datetime.datetime.now()
-        today = datetime.date.today().isoformat()
-        if now.hour == 23 and now.minute >= 55 and last_daily != today:
-            try:
-                s = daily_summary()
-                last_daily = today
-                _log('SYSTEM', 'daily_summary',
-                     f'fixed={len(s["fixed"])} escalated={len(s["escalated"])} '
-                     f'ci_fixed={s["ci"]["auto_fixed"]} ci_regressions={s["ci"]["regressions"]}')
-                print(s.get('eve_standup', ''), flush=True)
-                print(f'  (Full report: logs/bugwatcher_daily/{today}.json)', flush=True)
-                eve_speak(
-                    f"Hey! Daily standup time. Fixed {len(s['fixed'])} bugs. "
-                    + (f"Escalated {len(s['escalated'])} for the team. " if s['escalated'] else "")
-                    + "Tests all green. You're welcome!"
-                )
-            except Exception as exc:
-                _log('SYSTEM', 'daily_summary_error', str(exc))
+        now = time.time()
+        if now >= next_summary:
+            # Past the 23:59 end of the window (machine slept through it) —
+            # skip that day rather than filing a summary under the wrong date.
+            late         = now - next_summary >= 300
+            today        = datetime.date.today()
+            next_summary = _summary_deadline(today + datetime.timedelta(days=1))
+            today        = today.isoformat()
+            if not late:
+                try:
+                    s = daily_summary()
+                    _log('SYSTEM', 'daily_summary',
+                         f'fixed={len(s["fixed"])} escalated={len(s["escalated"])} '
+                         f'ci_fixed={s["ci"]["auto_fixed"]} ci_regressions={s["ci"]["regressions"]}')
+                    print(s.get('eve_standup', ''), flush=True)
+                    print(f'  (Full report: logs/bugwatcher_daily/{today}.json)', flush=True)
+                    eve_speak(
+                        f"Hey! Daily standup time. Fixed {len(s['fixed'])} bugs. "
+                        + (f"Escalated {len(s['escalated'])} for the team. " if s['escalated'] else "")
+                        + "Tests all green. You're welcome!"
+                    )
+                except Exception as exc:
+                    _log('SYSTEM', 'daily_summary_error', str(exc))
 
         if args.once:
             break
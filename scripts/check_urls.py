@@ -9,7 +9,7 @@ Usage:
     python scripts/check_urls.py
 """
 
-import json, os, sys, time, datetime
+import json, os, sys, time, datetime, gzip
 import urllib.request, urllib.error
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -97,11 +97,18 @@ def check(url, validate=None, timeout=15):
     # If we need JSON validation and only did HEAD, do a GET now
     if validate == 'json' and body is None:
         try:
+            # Only the first 32 KiB is ever parsed — ask for just that, compressed.
+            # Servers that ignore Range/Accept-Encoding send the plain full body.
             req2 = urllib.request.Request(
-                url, headers={'User-Agent': 'KAM-Sentinel-URLCheck/1.0'}
+                url, headers={'User-Agent':      'KAM-Sentinel-URLCheck/1.0',
+                              'Accept-Encoding': 'gzip',
+                              'Range':           'bytes=0-32767'}
             )
             with urllib.request.urlopen(req2, timeout=timeout) as resp2:
-                body = resp2.read(32768).decode('utf-8', errors='replace')
+                src = resp2
+                if (resp2.headers.get('Content-Encoding') or '').lower() == 'gzip':
+                    src = gzip.GzipFile(fileobj=resp2)
+                body = src.read(32768).decode('utf-8', errors='replace')
         except Exception:
             body = None
 
@@ -4,10 +4,12 @@ KAM Sentinel v1.4 — cross-platform (Windows / macOS / Linux)
 Hot path: pure in-memory reads (<1 ms per /api/stats request)
 All hardware I/O in background threads — server never blocks on sensors
 """
-from flask import Flask, jsonify, send_from_directory, request
-from collections import deque
+from flask import Flask, Response, jsonify, send_from_directory, request
+from collections import deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor
-import psutil, os, json, time, platform, datetime, threading, sys, subprocess, uuid, re, struct, math, hashlib
+from functools import lru_cache
+from itertools import islice
+import psutil, os, json, time, platform, datetime, threading, sys, subprocess, uuid, re, struct, math, heapq, bisect
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 if getattr(sys, 'frozen', False):
@@ -24,27 +26,29 @@ else:
 app = Flask(__name__, static_folder=ASSET_DIR)
 
 # ── Rate limiting ─────────────────────────────────────────────────────────────
-_rl, _rl_lock = {}, threading.Lock()
-RL_WIN, RL_MAX = 1.0, 10
+_rl, _rl_lock = OrderedDict(), threading.Lock()   # ip -> recent hits, least-recently-seen first
+RL_WIN, RL_MAX, RL_IPS_MAX = 1.0, 10, 4096
+_LOCAL_IPS = frozenset(('127.0.0.1', '::1'))
 
 def _rate_limited(ip):
     now = time.time()
     with _rl_lock:
-        w = [t for t in _rl.get(ip, []) if now - t < RL_WIN]
+        w = _rl.get(ip)
+        if w is None:
+            w = _rl[ip] = deque(maxlen=RL_MAX)
+            if len(_rl) > RL_IPS_MAX: _rl.popitem(last=False)   # evict the least-recently-seen IP
+        else: _rl.move_to_end(ip)
+        while w and now - w[0] >= RL_WIN: w.popleft()   # trim expired hits from the head, no rebuild
         if len(w) >= RL_MAX: return True
-        w.append(now); _rl[ip] = w
-        if len(_rl) > 500:
-            cut = now - RL_WIN
-            for k in [k for k, v in _rl.items() if not any(t >= cut for t in v)]:
-                del _rl[k]
+        w.append(now)
     return False
 
 @app.before_request
 def _guard():
     ip = request.remote_addr
-    if ip in ('127.0.0.1', '::1'): return
+    if ip in _LOCAL_IPS: return              # the dashboard itself — never touches _rl_lock
+    if request.method == 'POST': return jsonify(error='forbidden'), 403   # refused outright, no bucket needed
     if _rate_limited(ip):  return jsonify(error='rate limited'), 429
-    if request.method == 'POST': return jsonify(error='forbidden'), 403
 
 @app.after_request
 def _no_cache(response):
@@ -57,32 +61,35 @@ def _no_cache(response):
     return response
 
 # ── Feedback rate limiting & dedup ────────────────────────────────────────────
-_fb_rl, _fb_dedup, _fb_lock = {}, {}, threading.Lock()
+_fb_rl, _fb_lock = {}, threading.Lock()
+_fb_dedup = OrderedDict()         # (cat, msg) -> last seen; oldest first
 FB_RL_WIN, FB_RL_MAX = 60.0, 5   # 5 submissions per 60 s per IP
-FB_DEDUP_WIN = 3600.0             # same message rejected within 1 hour
+FB_DEDUP_WIN, FB_DEDUP_MAX = 3600.0, 1000   # same message rejected within 1 hour; cap on tracked messages
 
 def _fb_rate_limited(ip):
     """Return True if this IP has exceeded the feedback submission rate."""
     now = time.time()
     with _fb_lock:
-        w = [t for t in _fb_rl.get(ip, []) if now - t < FB_RL_WIN]
+        w = _fb_rl.get(ip)
+        if w is None: w = _fb_rl[ip] = deque(maxlen=FB_RL_MAX)
+        while w and now - w[0] >= FB_RL_WIN: w.popleft()
         if len(w) >= FB_RL_MAX: return True
-        w.append(now); _fb_rl[ip] = w
+        w.append(now)
     return False
 
 def _fb_duplicate(cat, msg):
     """Return True if an identical (category + message) was submitted within FB_DEDUP_WIN."""
-    key = hashlib.md5(f"{cat}:{msg.strip().lower()}".encode()).hexdigest()
+    key = (cat, msg.strip().lower())   # exact in-process key — no digest needed, can't collide
     now = time.time()
     with _fb_lock:
-        if key in _fb_dedup and now - _fb_dedup[key] < FB_DEDUP_WIN:
+        t = _fb_dedup.get(key)
+        if t is not None and now - t < FB_DEDUP_WIN:
             return True
-        _fb_dedup[key] = now
-        # prune stale entries to prevent unbounded growth
-        if len(_fb_dedup) > 1000:
-            cut = now - FB_DEDUP_WIN
-            for k in [k for k, v in _fb_dedup.items() if v < cut]:
-                del _fb_dedup[k]
+        _fb_dedup[key] = now; _fb_dedup.move_to_end(key)
+        # Entries are in time order, so expiry and the size cap only ever pop from the front
+        cut = now - FB_DEDUP_WIN
+        while _fb_dedup and (len(_fb_dedup) > FB_DEDUP_MAX or next(iter(_fb_dedup.values())) < cut):
+            _fb_dedup.popitem(last=False)
     return False
 
 # ── Input validation ──────────────────────────────────────────────────────────
@@ -97,18 +104,22 @@ FAN_CURVES = {
 }
 
 def _validate(d, depth=0):
-    if depth > 3:               return False, 'too nested'
-    if isinstance(d, dict):
-        if len(d) > 20:         return False, 'too many keys'
-        for k, v in d.items():
-            if not isinstance(k, str) or len(k) > 50: return False, f'bad key: {k}'
-            ok, e = _validate(v, depth+1)
-            if not ok: return False, e
-    elif isinstance(d, (int, float)):
-        if not (0 <= d <= 10000): return False, f'out of range: {d}'
-    elif isinstance(d, str):
-        if len(d) > 100:        return False, 'string too long'
-    elif d is not None and not isinstance(d, bool): return False, f'bad type: {type(d)}'
+    # Explicit stack instead of recursion; exact-type dispatch (json.loads only yields builtins)
+    stack = [(d, depth)]
+    while stack:
+        d, depth = stack.pop()
+        if depth > 3:               return False, 'too nested'
+        t = type(d)
+        if t is dict:
+            if len(d) > 20:         return False, 'too many keys'
+            for k in d:
+                if type(k) is not str or len(k) > 50: return False, f'bad key: {k}'
+            stack.extend((v, depth+1) for v in reversed(list(d.values())))
+        elif t is int or t is float:
+            if not (0 <= d <= 10000): return False, f'out of range: {d}'
+        elif t is str:
+            if len(d) > 100:        return False, 'string too long'
+        elif d is not None and t is not bool: return False, f'bad type: {t}'
     return True, None
 
 # ── Platform imports ──────────────────────────────────────────────────────────
@@ -123,6 +134,24 @@ if sys.platform == 'win32' and getattr(sys, 'frozen', False):
 try: import GPUtil; _GPU = True
 except ImportError: _GPU = False
 
+try: import orjson as _orjson       # optional C encoder for the JSONL hot path
+except ImportError: _orjson = None
+
+try: import numpy as _np             # optional vectorised kernels for the CPU/RAM benchmarks
+except ImportError: _np = None
+
+try: import waitress as _waitress   # optional production WSGI server — see run_server()
+except ImportError: _waitress = None
+
+def _json_bytes(o):
+    """Encode one JSON document (response body / cached blob) — orjson when installed, stdlib json otherwise."""
+    return _orjson.dumps(o) if _orjson else json.dumps(o).encode()
+
+def _jsonl_bytes(es):
+    """Encode entries as one JSONL payload — orjson when installed, stdlib json otherwise."""
+    if _orjson: return b'\n'.join(map(_orjson.dumps, es)) + b'\n'
+    return ''.join(json.dumps(e)+'\n' for e in es).encode('utf-8')
+
 def _get_gpus(timeout=5):
     """Call GPUtil.getGPUs() safely.
     CI guard: nvidia-smi on ubuntu-latest hangs indefinitely with no real GPU.
@@ -154,7 +183,8 @@ ACCESSIBILITY_FILE = os.path.join(PROF_DIR, 'accessibility.json')
 PREF_FILE          = os.path.join(PROF_DIR, 'preferences.json')
 CRASH_LOG          = os.path.join(LOG_DIR, 'crashes.jsonl')
 CRASH_FLAG         = os.path.join(LOG_DIR, 'crash.flag')
-for d in (BACKUP_DIR, LOG_DIR, PROF_DIR): os.makedirs(d, exist_ok=True)
+FEEDBACK_DIR       = os.path.join(LOG_DIR, 'feedback')
+for d in (BACKUP_DIR, LOG_DIR, PROF_DIR, FEEDBACK_DIR): os.makedirs(d, exist_ok=True)
 
 VER               = '1.7.1'
 UPDATE_CHECK_URL  = 'https://kypin00-web.github.io/KAM-Sentinel/version.json'
@@ -262,19 +292,29 @@ def _save_user_prefs(prefs):
 def _jgm_log_path():
     return _load_user_prefs().get('jgm_log_path', JGM_LOG_DEFAULT)
 
+_lhm_tl = threading.local()   # per-thread LHM WMI connection (COM objects can't cross threads)
+
+def _lhm_wmi():
+    """This thread's connection to the LHM WMI namespace, opened on first use."""
+    c = getattr(_lhm_tl, 'conn', None)
+    if c is None:
+        import wmi as _w
+        c = _lhm_tl.conn = _w.WMI(namespace='root/LibreHardwareMonitor')
+    return c
+
 def _read_fan_rpms():
     """Read fan RPMs from LibreHardwareMonitor WMI namespace. Windows-only."""
     if sys.platform != 'win32':
         return []
     try:
-        import wmi as _w
-        lhm = _w.WMI(namespace='root/LibreHardwareMonitor')
+        lhm = _lhm_wmi()
         fans = []
-        for sensor in lhm.Sensor():
+        for sensor in lhm.Sensor(['SensorType', 'Name', 'Value'], SensorType='Fan'):
             if sensor.SensorType == 'Fan':
                 fans.append({'name': sensor.Name, 'rpm': round(float(sensor.Value))})
         return fans
     except:
+        _lhm_tl.conn = None   # LHM closed/restarted — reconnect next time
         return []
 
 def _lhm_http_read(timeout=2):
@@ -352,9 +392,8 @@ def _lhm_read_sensors():
 
     # Option B: WMI namespace — requires LHM running as admin
     try:
-        import wmi as _w
-        lhm = _w.WMI(namespace='root/LibreHardwareMonitor')
-        for s in lhm.Sensor():
+        lhm = _lhm_wmi()
+        for s in lhm.Sensor(['SensorType', 'Name', 'Value']):   # column list, not SELECT *
             val = float(s.Value) if s.Value is not None else None
             if val is None:
                 continue
@@ -367,7 +406,7 @@ def _lhm_read_sensors():
         result['available'] = True
         result['source'] = 'wmi'
     except:
-        pass
+        _lhm_tl.conn = None
     return result
 
 def _lhm_is_running():
@@ -399,13 +438,17 @@ def _validate_lhm_url(url):
             and url.startswith(_LHM_ALLOWED_PREFIX)
             and url.endswith('.zip'))
 
+def _hw_publish(**kw):
+    """Publish an updated _hw_cache as a fresh dict — never mutated after publication."""
+    global _hw_cache
+    with _hw_lock: _hw_cache = dict(_hw_cache, **kw)
+
 def _count_na_sensors():
     """Count how many primary sensors are currently N/A."""
-    count = 0
-    with _hw_lock:
-        if _hw_cache['cpu_temp'] is None: count += 1
-        if _hw_cache['cpu_volt'] is None: count += 1
-        if not _hw_cache['lhm_fans']:     count += 1
+    h, count = _hw_cache, 0
+    if h['cpu_temp'] is None: count += 1
+    if h['cpu_volt'] is None: count += 1
+    if not h['lhm_fans']:     count += 1
     return count
 
 _active_fan_preset = _load_active_preset()
@@ -448,7 +491,7 @@ BG_SUSPEND_ONLY = frozenset({'MsMpEng.exe'})  # Defender scan — suspend, never
 
 # ── Locks ─────────────────────────────────────────────────────────────────────
 _state_lock = threading.Lock()
-_hw_lock    = threading.Lock()   # guards unified HW cache (WMI + Mac sensors)
+_hw_lock    = threading.Lock()   # serialises _hw_cache writers; readers take no lock
 _log_lock   = threading.Lock()
 _err_lock   = threading.Lock()
 
@@ -458,38 +501,88 @@ history  = {k: deque(maxlen=MAX_HIST) for k in
     ('timestamps','cpu_usage','cpu_temp','gpu_usage','gpu_temp','ram_usage','net_down','net_up')}
 _sustained  = {'cpu': deque(maxlen=12), 'gpu': deque(maxlen=12)}
 
-# Unified hardware cache — one structure for all platforms
+# Unified hardware cache — one structure for all platforms. Writers publish a new dict
+# (copy + rebind under _hw_lock); readers grab the reference once and need no lock.
 _hw_cache   = {'cpu_temp': None, 'cpu_volt': None, 'ts': 0, 'ttl': 10,
                'lhm_running': False, 'lhm_fans': []}
 
+# Published by _gpu_worker as a whole new dict each read (single atomic rebind) and
+# never mutated afterwards — readers need no lock.
 _gpu_cache      = dict(usage=None, temp=None, name='N/A', vram_used=None, vram_total=None)
-_gpu_lock       = threading.Lock()
 
 _fps_history = deque(maxlen=60)
 _fps_cache   = dict(fps=None, fps_1pct_low=None, frametime_ms=None,
                     source='rtss' if sys.platform == 'win32' else 'not_supported',
-                    available=False)
-_fps_lock    = threading.Lock()
+                    available=False)   # rebound whole by _fps_worker (sole writer) — read lock-free
 
 # ── Auto-update download state ─────────────────────────────────────────────
 _update_lock  = threading.Lock()
 _update_state = {'state': 'idle', 'progress': 0, 'path': None, 'error': None}
 
-_net_prev, _net_ts, _net_warmed_up = psutil.net_io_counters(), time.time(), False
-_net_base       = deque(maxlen=36)
+_net_io, _vmem = psutil.net_io_counters, psutil.virtual_memory   # bound once for the per-sample reads
+_net_prev, _net_ts, _net_warmed_up = _net_io(), time.time(), False
+_net_base       = deque(maxlen=36)   # resized to the baseline_samples window by _compile_thresholds()
+# Running sums of _sustained / _net_base so each tick's averages are O(1) — guarded by _state_lock
+_roll_sum       = {'cpu': 0.0, 'gpu': 0.0, 'net': 0.0}
+
+def _roll_push(dq, key, v):
+    """Append v to a bounded deque, keeping _roll_sum[key] equal to sum(dq). Caller holds _state_lock."""
+    if len(dq) == dq.maxlen: _roll_sum[key] -= dq[0]
+    dq.append(v); _roll_sum[key] += v
 
 _cpu_cache      = 0.0          # written by background sampler, read on hot path
-_log_buffer, _log_ts   = [], time.time()
+_cpu_freq_ghz   = None         # ditto — refreshed every 2s via _cpu_freq_fast()
+_CPU_CORES      = psutil.cpu_count(logical=False)   # static — read once, not per tick
+_CPU_THREADS    = psutil.cpu_count(logical=True)
+_RAM_TOTAL_GB   = round(psutil.virtual_memory().total/1024**3,2)   # installed RAM doesn't change at runtime
+_stats_cache    = None         # (sample, encoded body) of the last _live_stats(); reused by /api/stats within
+                               # STATS_MIN_INTERVAL. Swapped by rebinding, never mutated — treat as read-only.
+STATS_MIN_INTERVAL = 1.0       # matches the 1 s CPU sampler; below the dashboard's fastest (2 s) refresh
+_log_buffer            = []
 _err_buf, _err_ts   = [], time.time()
+_tl_buf             = []       # local telemetry lines awaiting _err_writer — guarded by _err_lock
 
 # ── Background: CPU sampler ───────────────────────────────────────────────────
+_cpu_ready = threading.Event()   # set once the first real cpu_percent sample has landed
+
+_CPUINFO_MHZ = re.compile(rb'^cpu MHz\s*:\s*([\d.]+)', re.M)
+_cpuinfo_ok  = sys.platform.startswith('linux')   # cleared for good if /proc/cpuinfo has no MHz lines (ARM)
+
+def _cpu_freq_fast():
+    """Average current CPU clock in GHz. Linux: one /proc/cpuinfo read instead of psutil's
+    per-core sysfs walk (cur/min/max files for every CPU). Elsewhere: psutil.cpu_freq()."""
+    global _cpuinfo_ok
+    if _cpuinfo_ok:
+        try:
+            with open('/proc/cpuinfo', 'rb') as f: mhz = _CPUINFO_MHZ.findall(f.read())
+            if mhz: return round(sum(map(float, mhz)) / len(mhz) / 1000, 2)
+        except OSError: pass
+        _cpuinfo_ok = False
+    f = psutil.cpu_freq()
+    return round(f.current/1000, 2) if f else None
+
 def _cpu_loop():
-    global _cpu_cache
+    """Sampler for the cheap, non-blocking reads: CPU % every 1s, clock and RTSS FPS on alternate 2s ticks.
+    Slow sources (nvidia-smi, WMI/LHM, ioreg) keep their own threads so they can't stall it."""
+    global _cpu_cache, _cpu_freq_ghz
+    has_freq = getattr(psutil, 'cpu_freq', None) is not None
+    has_fps  = sys.platform == 'win32'      # RTSS is Windows-only; elsewhere _fps_cache stays unavailable
+    try: psutil.cpu_percent(interval=None)   # prime the delta; first call always reports 0.0
+    except: pass
+    nxt, tick = time.monotonic(), 0
     while True:
-        try: _cpu_cache = psutil.cpu_percent(interval=1.0)
+        # Fixed 1s cadence on the monotonic clock — the cpu_freq read doesn't accumulate as drift
+        nxt += 1.0
+        delay = nxt - time.monotonic()
+        if delay > 0: time.sleep(delay)
+        else: nxt = time.monotonic()       # fell behind (suspend / long stall): resync, don't burst
+        try: _cpu_cache = psutil.cpu_percent(interval=None); _cpu_ready.set()
         except: pass
-
-threading.Thread(target=_cpu_loop, daemon=True).start()
+        tick += 1
+        if has_freq and tick & 1:             # clock every 2s (dashboard refreshes at 2s at the fastest)
+            try: _cpu_freq_ghz = _cpu_freq_fast()
+            except: pass
+        if has_fps and not tick & 1: _fps_worker()
 
 # ── Privacy-safe telemetry helpers ───────────────────────────────────────────
 _CPU_MAP = [('ryzen 9','AMD Ryzen 9'),('ryzen 7','AMD Ryzen 7'),('ryzen 5','AMD Ryzen 5'),
@@ -501,12 +594,14 @@ _GPU_MAP = [('RTX 40','NVIDIA RTX 40xx'),('RTX 30','NVIDIA RTX 30xx'),
             ('RTX 20','NVIDIA RTX 20xx'),('GTX 16','NVIDIA GTX 16xx'),
             ('GTX 10','NVIDIA GTX 10xx'),('RX 7','AMD RX 7xxx'),('RX 6','AMD RX 6xxx')]
 
+@lru_cache(maxsize=8)   # only ever called with this machine's one or two model strings
 def _cpu_class(n):
     nl = n.lower()
     for k,v in _CPU_MAP:
         if k in nl: return v
     return 'AMD (other)' if 'amd' in nl else 'Intel (other)' if 'intel' in nl else 'Unknown'
 
+@lru_cache(maxsize=8)
 def _gpu_class(n):
     nu = n.upper()
     for k,v in _GPU_MAP:
@@ -517,6 +612,7 @@ def _gpu_class(n):
     if 'INTEL' in nu: return 'Intel GPU'
     return 'Unknown'
 
+@lru_cache(maxsize=1)   # OS release can't change under a running process
 def _os_class():
     if sys.platform == 'win32':
         try: return 'Windows 11' if int(platform.version().split('.')[-1]) >= 22000 else 'Windows 10'
@@ -532,11 +628,12 @@ def _os_class():
 def _get_install_id():
     f = os.path.join(PROF_DIR, 'install_id.json')
     try:
-        if os.path.exists(f):
-            return json.load(open(f, encoding='utf-8'))['id']
+        with open(f, encoding='utf-8') as fh: return json.load(fh)['id']
     except: pass
     nid = str(uuid.uuid4())
-    try: json.dump({'id': nid, 'created': datetime.datetime.now().isoformat()}, open(f,'w',encoding='utf-8'))
+    try:
+        with open(f,'w',encoding='utf-8') as fh:
+            json.dump({'id': nid, 'created': datetime.datetime.now().isoformat()}, fh)
     except: pass
     return nid
 
@@ -548,24 +645,57 @@ def _post_telemetry(payload):
             {'Content-Type':'application/json','User-Agent':f'KAMSentinel/{VER}'}), timeout=5)
     except: pass
 
+_telemetry_base = None   # per-process fields, built once the startup scan has published _sysinfo
+
 def _telemetry_payload(event, err=None):
-    si = _sysinfo if '_sysinfo' in globals() else {}
-    gb = next((s for s in (4,8,16,24,32,48,64,128) if round(si.get('ram_total_gb',0)) <= s),
-              round(si.get('ram_total_gb',0)))
-    p = dict(install_id=_install_id, event=event, version=VER, platform=sys.platform,
-             os=_os_class(), cpu_class=_cpu_class(si.get('cpu_name','')),
-             cpu_cores=si.get('cpu_threads',0), ram_gb=gb,
-             gpu_class=_gpu_class(si.get('gpu_name','N/A')), ts=int(time.time()))
+    global _telemetry_base
+    b = _telemetry_base
+    if b is None:
+        si = _sysinfo if '_sysinfo' in globals() else {}
+        gb = next((s for s in (4,8,16,24,32,48,64,128) if round(si.get('ram_total_gb',0)) <= s),
+                  round(si.get('ram_total_gb',0)))
+        b = dict(install_id=_install_id, version=VER, platform=sys.platform,
+                 os=_os_class(), cpu_class=_cpu_class(si.get('cpu_name','')),
+                 cpu_cores=si.get('cpu_threads',0), ram_gb=gb,
+                 gpu_class=_gpu_class(si.get('gpu_name','N/A')))
+        if si: _telemetry_base = b   # events before the scan finishes rebuild from partial info
+    p = dict(b, event=event, ts=int(time.time()))
     if err: p['error'] = str(err)[:200]
     return p
 
+_append_fhs, _append_lock = {}, threading.Lock()   # path -> unbuffered append handle, kept open for the session
+
+def _append(path, data):
+    """Append bytes to a JSONL file through a cached handle — one write(2), no open/close per call."""
+    with _append_lock:
+        f = _append_fhs.get(path)
+        if f is not None and os.fstat(f.fileno()).st_nlink == 0:
+            _append_fhs.pop(path, None)   # unlinked under us (logs/ cleared): POSIX writes would vanish into the orphaned inode
+            try: f.close()
+            except OSError: pass
+            f = None
+        if f is None:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)   # recreate a cleared logs/ dir
+            f = _append_fhs[path] = open(path, 'ab', buffering=0)
+        try: f.write(data)
+        except OSError:
+            _append_fhs.pop(path, None)   # reopen on the next call (file deleted, disk error…)
+            try: f.close()
+            except OSError: pass
+            raise
+
+def _append_close():
+    with _append_lock:
+        for f in _append_fhs.values():
+            try: f.close()
+            except OSError: pass
+        _append_fhs.clear()
+
 def _track(event, err=None):
     p = _telemetry_payload(event, err)
-    try:
-        tl = os.path.join(PROF_DIR,'telemetry.jsonl')
-        with open(tl,'a',encoding='utf-8') as f: f.write(json.dumps(p)+'\n')
-    except: pass
-    threading.Thread(target=_post_telemetry, args=(p,), daemon=True).start()
+    with _err_lock: _tl_buf.append(p)
+    _err_wake.set()                      # written by _err_writer — no disk I/O on the caller's thread
+    if TELEMETRY_URL: threading.Thread(target=_post_telemetry, args=(p,), daemon=True).start()
 
 # ── Error tracking ────────────────────────────────────────────────────────────
 def _log_err(ctx, exc):
@@ -573,58 +703,95 @@ def _log_err(ctx, exc):
              version=VER, platform=sys.platform,
              context=ctx[:100], error=str(exc)[:200], type=type(exc).__name__)
     with _err_lock: _err_buf.append(e)
-    threading.Thread(target=_flush_errs, daemon=True).start()
-    _track('error', exc)
+    _track('error', exc)                 # wakes _err_writer — no thread spawned per error
 
 def _flush_errs():
+    """Write buffered errors and telemetry lines — one write per file per drain."""
     global _err_ts
     with _err_lock:
-        if not _err_buf: return
         es, _err_buf[:] = list(_err_buf), []
-        _err_ts = time.time()
-    try:
-        with open(os.path.join(LOG_DIR,'errors.jsonl'),'a',encoding='utf-8') as f:
-            for e in es: f.write(json.dumps(e)+'\n')
-    except: pass
+        ts, _tl_buf[:]  = list(_tl_buf), []
+        if es: _err_ts = time.time()
+    for path, rows in ((os.path.join(LOG_DIR,'errors.jsonl'), es), (os.path.join(PROF_DIR,'telemetry.jsonl'), ts)):
+        if not rows: continue
+        try: _append(path, _jsonl_bytes(rows))
+        except: pass
+
+ERR_FLUSH_SECS = 2
+_err_wake      = threading.Event()
+
+def _err_writer():
+    """Background: drain _err_buf / _tl_buf to errors.jsonl / telemetry.jsonl. Waits ERR_FLUSH_SECS
+    after the first entry so a burst of failures lands in one write per file."""
+    while True:
+        _err_wake.wait(); time.sleep(ERR_FLUSH_SECS); _err_wake.clear()
+        _flush_errs()
+
+threading.Thread(target=_err_writer, daemon=True).start()
 
 # ── Hardware: CPU temp + voltage (all platforms, 10 s cache) ──────────────────
 # Pre-compile Mac GPU regex once
 _IOREG_RE = re.compile(r'"Device Utilization %"\s*=\s*(\d+)')
 _VRAM_RE  = re.compile(r'(?:VRAM|Video RAM)[^:]*:\s*(\d+)\s*MB', re.IGNORECASE)
 
-def _hw_read_cpu():
-    """Platform-specific CPU temp + voltage. Called by background scheduler only."""
-    temp = volt = None
-    if sys.platform == 'win32':
-        try:
-            ts = psutil.sensors_temperatures()
-            if ts:
+# psutil.sensors_temperatures() walks every hwmon node (~150 ms on Linux) and CPU
+# temp barely moves between scheduler ticks — re-read it at most every SENSOR_TEMP_TTL.
+SENSOR_TEMP_TTL    = 20
+_sensor_temp_cache = {'val': None, 't': 0.0, 'key': None, 'tz': None}   # touched only by the _hw_scheduler thread
+# Known CPU hwmon drivers, best first. Anything else (nvme, drivetemp, w1 1-wire probes,
+# wifi, amdgpu) is not a CPU reading and is skipped unless its name says cpu/core/soc.
+_CPU_SENSOR_KEYS   = ('coretemp', 'k10temp', 'zenpower', 'cpu_thermal', 'acpitz')
+
+def _sensor_cpu_temp():
+    """CPU temp from psutil.sensors_temperatures(), cached for SENSOR_TEMP_TTL seconds."""
+    now = time.time()
+    if now - _sensor_temp_cache['t'] < SENSOR_TEMP_TTL: return _sensor_temp_cache['val']
+    temp = None
+    try:
+        ts = psutil.sensors_temperatures()
+        if ts:
+            if sys.platform == 'win32':
                 for es in ts.values():
                     for e in es:
                         if e.current > 0: temp = round(e.current, 1); break
                     if temp: break
-        except: pass
-        if _WMI and _wmi:
+            else:
+                pinned = _sensor_temp_cache['key']
+                keys = (pinned,) if pinned in ts else _CPU_SENSOR_KEYS + tuple(
+                    k for k in ts if k not in _CPU_SENSOR_KEYS and any(w in k.lower() for w in ('cpu','core','soc')))
+                for key in keys:
+                    for e in ts.get(key) or ():
+                        if 0 < e.current < 120:
+                            temp = round(e.current, 1); _sensor_temp_cache['key'] = key; break
+                    if temp is not None: break
+                if temp is None: _sensor_temp_cache['key'] = None   # pinned sensor went away — rescan next time
+    except: pass
+    _sensor_temp_cache.update(val=temp, t=now)
+    return temp
+
+def _hw_read_cpu(conn=None):
+    """Platform-specific CPU temp + voltage. Called by background scheduler only.
+    conn: WMI connection owned by the calling thread (defaults to the startup one)."""
+    temp, volt = _sensor_cpu_temp(), None
+    if sys.platform == 'win32':
+        w = conn or _wmi
+        if _WMI and w:
             if temp is None:
                 try:
-                    for t in _wmi.MSAcpi_ThermalZoneTemperature():
+                    # Once a zone gives a sane reading, query only that zone (WHERE InstanceName=...)
+                    pin = _sensor_temp_cache.get('tz')
+                    for t in w.MSAcpi_ThermalZoneTemperature(['CurrentTemperature', 'InstanceName'],
+                                                             **({'InstanceName': pin} if pin else {})):
                         c = round((t.CurrentTemperature/10.0)-273.15, 1)
-                        if 0 < c < 120: temp = c; break
-                except: pass
+                        if 0 < c < 120: temp = c; _sensor_temp_cache['tz'] = t.InstanceName; break
+                    if temp is None: _sensor_temp_cache['tz'] = None
+                except: _sensor_temp_cache['tz'] = None
             try:
-                for v in _wmi.Win32_Processor():
-                    if getattr(v,'CurrentVoltage',None):
-                        volt = round(v.CurrentVoltage/10.0, 3); break
+                for v in w.Win32_Processor(['CurrentVoltage']):
+                    cv = v.CurrentVoltage            # single COM property fetch per row
+                    if cv: volt = round(cv/10.0, 3); break
             except: pass
     elif sys.platform == 'darwin':
-        try:
-            ts = psutil.sensors_temperatures()
-            if ts:
-                for es in ts.values():
-                    for e in es:
-                        if 0 < e.current < 120: temp = round(e.current,1); break
-                    if temp: break
-        except: pass
         if temp is None:
             try:
                 r = subprocess.run(['osx-cpu-temp'], capture_output=True, text=True, timeout=2)
@@ -632,34 +799,27 @@ def _hw_read_cpu():
                     m = re.search(r'(\d+\.?\d*)', r.stdout)
                     if m: temp = float(m.group(1))
             except: pass
-    else:  # Linux
-        try:
-            ts = psutil.sensors_temperatures()
-            if ts:
-                for key in ('coretemp','k10temp','acpitz','cpu_thermal'):
-                    if key in ts and ts[key]: temp = round(ts[key][0].current, 1); break
-                if temp is None:
-                    for es in ts.values():
-                        for e in es:
-                            if 0 < e.current < 120: temp = round(e.current,1); break
-                        if temp: break
-        except: pass
     return temp, volt
 
 def _hw_scheduler():
-    """Background: refresh HW cache every ttl seconds."""
+    """Background: refresh HW cache every ttl seconds. All WMI/COM work lives here —
+    readers (get_cpu_temp_voltage, _live_stats) only ever see the cached values."""
+    conn = None
+    if sys.platform == 'win32' and _WMI:
+        # COM is per-thread: initialise it here and hold this thread's own long-lived
+        # connection instead of borrowing the one created on the main thread.
+        try:
+            import pythoncom; pythoncom.CoInitialize()
+            import wmi; conn = wmi.WMI()
+        except Exception as e: _log_err('hw_scheduler:wmi', e)
     while True:
         try:
-            temp, volt = _hw_read_cpu()          # generic WMI + psutil fallback
+            temp, volt = _hw_read_cpu(conn)      # generic WMI + psutil fallback
             lhm = _lhm_read_sensors()            # LHM WMI — higher quality if running
             if lhm['temp'] is not None: temp = lhm['temp']
             if lhm['volt'] is not None: volt = lhm['volt']
-            with _hw_lock:
-                _hw_cache.update(
-                    cpu_temp=temp, cpu_volt=volt, ts=time.time(),
-                    lhm_running=lhm['available'],
-                    lhm_fans=lhm['fans']
-                )
+            _hw_publish(cpu_temp=temp, cpu_volt=volt, ts=time.time(),
+                        lhm_running=lhm['available'], lhm_fans=lhm['fans'])
         except Exception as e:
             _log_err('hw_scheduler', e)
         time.sleep(_hw_cache['ttl'])
@@ -667,10 +827,14 @@ def _hw_scheduler():
 threading.Thread(target=_hw_scheduler, daemon=True).start()
 
 def get_cpu_temp_voltage():
-    with _hw_lock: return _hw_cache['cpu_temp'], _hw_cache['cpu_volt']
+    h = _hw_cache
+    return h['cpu_temp'], h['cpu_volt']
 
 # ── Hardware: GPU (all platforms, background thread) ──────────────────────────
+_gpu_static = None   # macOS: {name, vram_total} from the first successful system_profiler run
+
 def _read_gpu():
+    global _gpu_static
     base = dict(usage=None, temp=None, name='N/A', vram_used=None, vram_total=None)
     if _GPU:
         try:
@@ -682,15 +846,19 @@ def _read_gpu():
                 return base
         except: pass
     if sys.platform == 'darwin':
-        try:
-            r = subprocess.run(['system_profiler','SPDisplaysDataType'],
-                               capture_output=True, text=True, timeout=6)
-            if r.returncode == 0:
-                for ln in r.stdout.splitlines():
-                    if 'Chipset Model:' in ln: base['name'] = ln.split(':',1)[1].strip()
-                    m = _VRAM_RE.search(ln)
-                    if m: base['vram_total'] = int(m.group(1))
-        except: pass
+        if _gpu_static is None:          # name/VRAM can't change at runtime — system_profiler once
+            try:
+                r = subprocess.run(['system_profiler','SPDisplaysDataType'],
+                                   capture_output=True, text=True, timeout=6)
+                if r.returncode == 0:
+                    st = {}
+                    for ln in r.stdout.splitlines():
+                        if 'Chipset Model:' in ln: st['name'] = ln.split(':',1)[1].strip()
+                        m = _VRAM_RE.search(ln)
+                        if m: st['vram_total'] = int(m.group(1))
+                    _gpu_static = st
+            except: pass
+        base.update(_gpu_static or {})
         try:
             r = subprocess.run(['ioreg','-r','-c','IOAccelerator'],
                                capture_output=True, text=True, timeout=4)
@@ -700,82 +868,126 @@ def _read_gpu():
         except: pass
     return base
 
+_gpu_wanted = threading.Event()   # set by readers; the worker only polls after someone looked
+_gpu_wanted.set()                 # take one reading at boot
+
 def _gpu_worker():
+    global _gpu_cache
     while True:
+        _gpu_wanted.wait(); _gpu_wanted.clear()   # idle (no dashboard open) -> no nvidia-smi spawns
         try:
-            g = _read_gpu()
-            with _gpu_lock: _gpu_cache.update(g)
+            _gpu_cache = _read_gpu()
         except Exception as e: _log_err('gpu_loop', e)
         time.sleep(5)
 
 threading.Thread(target=_gpu_worker, daemon=True).start()
 def get_gpu_cached():
-    with _gpu_lock: return dict(_gpu_cache)
+    # _gpu_worker never mutates a published dict — it rebinds a fresh one — so the current
+    # snapshot is handed out as-is. Callers treat it as read-only.
+    if not _gpu_wanted.is_set(): _gpu_wanted.set()   # is_set() is lock-free; set() only once per cycle
+    return _gpu_cache
 
 # ── FPS Counter (RTSS shared memory, Windows-only) ────────────────────────────
+_RTSS_HDR = 140                               # magic .. FPS float at offset 136
+_RTSS_UNPACK_FPS = struct.Struct('<f').unpack_from
+_RTSS_MMAP = None   # kept open across polls once RTSS is seen; dropped on any miss
+
+def _rtss_drop():
+    global _RTSS_MMAP
+    m, _RTSS_MMAP = _RTSS_MMAP, None
+    if m is not None:
+        try: m.close()
+        except: pass
+
 def _read_rtss_fps():
     """Read current FPS from RTSS shared memory. Returns float or None."""
+    global _RTSS_MMAP
     if sys.platform != 'win32':
         return None
     try:
-        import mmap
-        m = mmap.mmap(-1, 4096, tagname='RTSSSharedMemoryV2', access=mmap.ACCESS_READ)
-        data = m.read(4096)
-        m.close()
-        if data[0:4] != b'RTSS':  # magic bytes — empty mapping means RTSS not running
+        if _RTSS_MMAP is None:
+            import mmap
+            _RTSS_MMAP = mmap.mmap(-1, 4096, tagname='RTSSSharedMemoryV2', access=mmap.ACCESS_READ)
+        m = _RTSS_MMAP
+        m.seek(0)
+        data = m.read(_RTSS_HDR)
+        # Magic bytes — an empty mapping means RTSS is not running. Don't hold a
+        # handle to a section we created ourselves, or RTSS would attach to our
+        # 4 KB view on startup; close it and look the name up again next poll.
+        if data[0:4] != b'RTSS':
+            _rtss_drop()
             return None
-        fps = struct.unpack_from('<f', data, 136)[0]
+        fps = _RTSS_UNPACK_FPS(data, 136)[0]
         return round(fps, 1) if fps > 0 else None
     except:
+        _rtss_drop()
         return None
 
 def _fps_worker():
-    while True:
-        try:
-            fps_val = _read_rtss_fps()
-            if fps_val is not None:
-                _fps_history.append(fps_val)
-                h = sorted(_fps_history)          # ascending: lowest FPS first
-                n = max(1, len(h) // 100)         # 1% of samples, minimum 1
-                low = round(sum(h[:n]) / n, 1)
-                ft  = round(1000.0 / fps_val, 2)
-                with _fps_lock:
-                    _fps_cache.update(fps=fps_val, fps_1pct_low=low,
-                                      frametime_ms=ft, available=True)
-            else:
-                with _fps_lock:
-                    _fps_cache.update(fps=None, fps_1pct_low=None,
-                                      frametime_ms=None, available=False)
-        except Exception as e:
-            _log_err('fps_worker', e)
-        time.sleep(2)
+    """One RTSS poll, run every other tick of the _cpu_loop sampler."""
+    global _fps_cache
+    try:
+        fps_val = _read_rtss_fps()
+        if fps_val is not None:
+            _fps_history.append(fps_val)
+            n = max(1, len(_fps_history) // 100)   # 1% of samples, minimum 1
+            low = round(sum(heapq.nsmallest(n, _fps_history)) / n, 1)   # n == 1 -> a plain min()
+            ft  = round(1000.0 / fps_val, 2)
+            _fps_cache = dict(_fps_cache, fps=fps_val, fps_1pct_low=low,
+                              frametime_ms=ft, available=True)
+        elif _fps_cache['available']:
+            _fps_cache = dict(_fps_cache, fps=None, fps_1pct_low=None,
+                              frametime_ms=None, available=False)
+    except Exception as e:
+        _log_err('fps_worker', e)
 
-threading.Thread(target=_fps_worker, daemon=True).start()
+# Started here rather than next to _cpu_loop so _fps_worker exists before its first tick
+threading.Thread(target=_cpu_loop, daemon=True).start()
 
-# ── Benchmark functions (pure Python, no external deps) ───────────────────────
-def _bench_worker_fn(n):
-    """Float math workload: sqrt+log loop. Used for both ST and MT CPU tests."""
+# ── Benchmark functions (NumPy when installed, pure-Python fallback) ─────────
+_BENCH_BLOCK = 1 << 20   # 1M float64 per block -> 8 MB peak per worker
+
+def _bench_kernel(python=False):
+    return 'python' if python or _np is None else 'numpy'
+
+def _bench_worker_fn(n, python=False):
+    """Float math workload: sum of sqrt(i)+log(i) for i in 1..n. Used for both ST and MT CPU tests.
+    The NumPy kernel runs in C and releases the GIL, so MT actually scales across cores;
+    python=True keeps the interpreter loop (interpreter-throughput mode / no NumPy)."""
+    if _bench_kernel(python) == 'python':
+        s = 0.0
+        for i in range(1, n + 1):
+            s += math.sqrt(float(i)) + math.log(float(i))
+        return s
     s = 0.0
-    for i in range(1, n + 1):
-        s += math.sqrt(float(i)) + math.log(float(i))
+    for lo in range(1, n + 1, _BENCH_BLOCK):
+        a = _np.arange(lo, min(lo + _BENCH_BLOCK, n + 1), dtype=_np.float64)
+        s += float(_np.sqrt(a).sum() + _np.log(a).sum())
     return s
 
-def bench_cpu_st(n=4_000_000):
-    """Single-threaded CPU benchmark. Returns score (kOps/s) + elapsed."""
+def _bench_n(n, python):
+    # ~same wall time either way: the vectorised kernel gets 16x the work
+    return n or (4_000_000 if _bench_kernel(python) == 'python' else 64_000_000)
+
+def bench_cpu_st(n=None, python=False):
+    """Single-threaded CPU benchmark. Returns score (kOps/s) + elapsed + kernel."""
+    n = _bench_n(n, python)
     t0 = time.perf_counter()
-    _bench_worker_fn(n)
+    _bench_worker_fn(n, python)
     elapsed = time.perf_counter() - t0
-    return dict(score=round(n / elapsed / 1000), elapsed_s=round(elapsed, 2))
+    return dict(score=round(n / elapsed / 1000), elapsed_s=round(elapsed, 2),
+                kernel=_bench_kernel(python))
 
-def bench_cpu_mt(n_per=4_000_000):
+def bench_cpu_mt(n_per=None, python=False):
     """Multi-threaded CPU benchmark spread across physical cores."""
-    cores = max(1, psutil.cpu_count(logical=False) or 2)
+    n_per = _bench_n(n_per, python)
+    cores = max(1, _CPU_CORES or 2)
     t0 = time.perf_counter()
     with ThreadPoolExecutor(max_workers=cores) as ex:
-        list(ex.map(_bench_worker_fn, [n_per] * cores))
+        list(ex.map(_bench_worker_fn, [n_per] * cores, [python] * cores))
     elapsed = time.perf_counter() - t0
     return dict(score=round(cores * n_per / elapsed / 1000),
-                elapsed_s=round(elapsed, 2), cores=cores)
+                elapsed_s=round(elapsed, 2), cores=cores, kernel=_bench_kernel(python))
 
 def bench_ram_bw(size_mb=256):
     """Sequential RAM write+read. Returns GB/s for each pass."""
@@ -788,15 +1000,27 @@ def bench_ram_bw(size_mb=256):
         for i in range(size_mb):
             mv[i * chunk:(i + 1) * chunk] = filler
         w_el = time.perf_counter() - t0
+        # Read pass: find() of a byte that isn't there is one memchr() over the whole buffer —
+        # a streaming read with no copy (bytes(buf) allocated and wrote a second buffer).
         t1 = time.perf_counter()
-        _ = bytes(buf)
+        buf.find(1)
         r_el = time.perf_counter() - t1
-        del _; del buf
+        del mv, buf
         return dict(write_gbps=round(size_mb / w_el / 1024, 2),
                     read_gbps=round(size_mb / r_el / 1024, 2))
     except MemoryError:
         return dict(write_gbps=0, read_gbps=0, error='MemoryError')
 
+def _nocache(fd):
+    """Best-effort page-cache bypass so bench_disk times the device, not RAM. True if applied."""
+    try:
+        if hasattr(os, 'posix_fadvise'):      # Linux: evict the file's (clean, fsync'd) cached pages
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED); return True
+        if sys.platform == 'darwin':          # macOS: I/O on this fd bypasses the unified buffer cache
+            import fcntl; fcntl.fcntl(fd, fcntl.F_NOCACHE, 1); return True
+    except (OSError, AttributeError): pass
+    return False                              # Windows: read pass may be served from cache
+
 def bench_disk(size_mb=128):
     """Sequential disk write+read (128 MB temp file). Returns MB/s for each pass."""
     chunk = 4 * 1024 * 1024  # 4 MB chunks
@@ -805,17 +1029,21 @@ def bench_disk(size_mb=128):
     tmp = os.path.join(DATA_DIR, f'_bench_{os.getpid()}.tmp')
     try:
         t0 = time.perf_counter()
-        with open(tmp, 'wb') as f:
+        with open(tmp, 'wb', buffering=0) as f:
+            uncached = _nocache(f.fileno())
             for _ in range(n):
                 f.write(data)
+            os.fsync(f.fileno())             # time the flush to the device, not just the copy into cache
         w_el = time.perf_counter() - t0
-        t1 = time.perf_counter()
-        with open(tmp, 'rb') as f:
-            while f.read(chunk):
+        buf = memoryview(bytearray(chunk))   # one buffer reused by readinto — no bytes object per chunk
+        with open(tmp, 'rb', buffering=0) as f:
+            uncached = _nocache(f.fileno()) and uncached
+            t1 = time.perf_counter()
+            while f.readinto(buf):
                 pass
-        r_el = time.perf_counter() - t1
+            r_el = time.perf_counter() - t1
         return dict(write_mbps=round(size_mb / w_el),
-                    read_mbps=round(size_mb / r_el))
+                    read_mbps=round(size_mb / r_el), uncached=uncached)
     except Exception as e:
         return dict(write_mbps=0, read_mbps=0, error=str(e)[:100])
     finally:
@@ -902,8 +1130,6 @@ def _run_benchmark(mode, run_id):
 def _write_bug_entry(trigger, fix, result):
     """Write a structured bug entry to logs/feedback/bug.jsonl for BugWatcher."""
     try:
-        fd = os.path.join(LOG_DIR, 'feedback')
-        os.makedirs(fd, exist_ok=True)
         now = datetime.datetime.now().isoformat()
         entry = {
             'bug_id':         str(uuid.uuid4()),
@@ -920,8 +1146,7 @@ def _write_bug_entry(trigger, fix, result):
             'last_seen':      now,
             'message':        f'Auto-filed: {trigger} — {result}',
         }
-        with open(os.path.join(fd, 'bug.jsonl'), 'a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + '\n')
+        _append(_FB_FILES['bug'], _jsonl_bytes((entry,)))
     except Exception as e:
         _log_err('write_bug_entry', e)
 
@@ -1089,32 +1314,58 @@ def _run_gpu_benchmark(run_id):
 
 
 # ── Network speed ─────────────────────────────────────────────────────────────
+_NET_ZERO = dict(upload_kbps=0, download_kbps=0, upload_display='0 KB/s', download_display='0 KB/s')
+
+def _fmt_rate(k):
+    return f'{k/1024:.2f} MB/s' if k > 1024 else f'{k:.0f} KB/s'
+
 def _net_speed():
     global _net_prev, _net_ts, _net_warmed_up
     try:
-        c = psutil.net_io_counters(); now = time.time()
+        c = _net_io(); now = time.time()
         if not _net_warmed_up:
             _net_prev, _net_ts, _net_warmed_up = c, now, True
-            return dict(upload_kbps=0, download_kbps=0, upload_display='0 KB/s', download_display='0 KB/s')
+            return dict(_NET_ZERO)
         el = max(now - _net_ts, 0.001)
         up = (c.bytes_sent - _net_prev.bytes_sent) / el / 1024
         dn = (c.bytes_recv - _net_prev.bytes_recv) / el / 1024
         _net_prev, _net_ts = c, now
-        fmt = lambda k: f'{k/1024:.2f} MB/s' if k > 1024 else f'{k:.0f} KB/s'
+        # Idle links skip formatting entirely: reuse the constant zero strings
         return dict(upload_kbps=round(up,1), download_kbps=round(dn,1),
-                    upload_display=fmt(up), download_display=fmt(dn))
+                    upload_display=_fmt_rate(up) if up >= 0.5 else '0 KB/s',
+                    download_display=_fmt_rate(dn) if dn >= 0.5 else '0 KB/s')
     except:
-        return dict(upload_kbps=0, download_kbps=0, upload_display='0 KB/s', download_display='0 KB/s')
+        return dict(_NET_ZERO)
 
 # ── System info (called once at startup) ──────────────────────────────────────
+def _wmi_rows(cls, props):
+    """One WMI class query on the calling pool thread: COM init + private connection."""
+    import pythoncom, wmi
+    pythoncom.CoInitialize()
+    try: return [{p: getattr(r, p) for p in props} for r in getattr(wmi.WMI(), cls)(props)]
+    finally: pythoncom.CoUninitialize()
+
+def _wmi_parallel(queries, timeout=2.5):
+    """Run independent WMI queries concurrently — wall time is the slowest one, not the sum.
+    A query that fails or misses the shared deadline yields [] (its thread is abandoned)."""
+    ex = ThreadPoolExecutor(max_workers=len(queries))
+    try:
+        futs = [ex.submit(_wmi_rows, c, p) for c, p in queries]
+        end, out = time.time() + timeout, []
+        for f in futs:
+            try: out.append(f.result(timeout=max(0, end - time.time())))
+            except: out.append([])
+        return out
+    finally:
+        ex.shutdown(wait=False)
+
 def _get_sysinfo():
     i = dict(os=platform.system(), os_version=platform.version(), os_release=platform.release(),
              os_display=_os_class(),
              hostname=platform.node(),
              windows_dir=os.environ.get('SystemRoot', os.environ.get('HOME', 'N/A')) if sys.platform == 'win32' else os.environ.get('HOME', 'N/A'),
              system_dir_label='Windows Dir' if sys.platform == 'win32' else 'Home Dir',
-             cpu_name=platform.processor(), cpu_cores=psutil.cpu_count(logical=False),
-             cpu_threads=psutil.cpu_count(logical=True))
+             cpu_name=platform.processor(), cpu_cores=_CPU_CORES, cpu_threads=_CPU_THREADS)
     freq = None
     if getattr(psutil, 'cpu_freq', None):
         try:
@@ -1138,15 +1389,12 @@ def _get_sysinfo():
     if sys.platform == 'win32':
         i['directx'] = 'DirectX 12'
         if _WMI and _wmi:
-            try:
-                for cs in _wmi.Win32_ComputerSystem(): i['manufacturer']=cs.Manufacturer; i['model']=cs.Model
-            except: pass
-            try:
-                for b in _wmi.Win32_BIOS(): i['bios_version'] = b.SMBIOSBIOSVersion or b.Version or 'N/A'
-            except: pass
-            try:
-                for mb in _wmi.Win32_BaseBoard(): i['motherboard'] = f'{mb.Manufacturer} {mb.Product}'
-            except: pass
+            cs, bios, mb = _wmi_parallel((('Win32_ComputerSystem', ['Manufacturer', 'Model']),
+                                          ('Win32_BIOS',           ['SMBIOSBIOSVersion', 'Version']),
+                                          ('Win32_BaseBoard',      ['Manufacturer', 'Product'])))
+            for r in cs:   i['manufacturer'] = r['Manufacturer']; i['model'] = r['Model']
+            for r in bios: i['bios_version'] = r['SMBIOSBIOSVersion'] or r['Version'] or 'N/A'
+            for r in mb:   i['motherboard']  = f"{r['Manufacturer']} {r['Product']}"
         try:
             import winreg; k = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r'SOFTWARE\Microsoft\DirectX')
             v,_ = winreg.QueryValueEx(k,'Version'); i['directx'] = f'DirectX 12 (v{v})'
@@ -1192,106 +1440,215 @@ def _get_sysinfo():
         if i['gpu_vram_mb'] == 'N/A' and i['gpu_name'] != 'N/A':
             i['gpu_vram_display'] = 'Unified (shared with system)'
 
-    disks = []
-    for p in psutil.disk_partitions():
-        try:
-            u = psutil.disk_usage(p.mountpoint)
+    i['disks'] = _disk_list(); i['captured_at'] = datetime.datetime.now().isoformat()
+    return i
+
+# Read-only images / RAM-backed / optical mounts — never a "disk" the user cares about
+_PSEUDO_FS = frozenset({'squashfs', 'tmpfs', 'devtmpfs', 'overlay', 'iso9660', 'udf', 'cdfs'})
+
+def _disk_list():
+    """Usage for real partitions. statvfs/GetDiskFreeSpaceEx run in parallel with a per-mount
+    timeout, so one slow network or sleeping drive can't hold up the startup scan."""
+    parts = [p for p in psutil.disk_partitions(all=False)
+             if p.fstype.lower() not in _PSEUDO_FS and 'cdrom' not in p.opts
+             and not p.device.startswith('/dev/loop')]
+    ex = ThreadPoolExecutor(max_workers=4)
+    try:
+        futs = [(p, ex.submit(psutil.disk_usage, p.mountpoint)) for p in parts]
+        disks = []
+        for p, f in futs:
+            try: u = f.result(timeout=2)
+            except: continue
             disks.append(dict(device=p.device, mountpoint=p.mountpoint,
                 total_gb=round(u.total/1024**3,1), used_gb=round(u.used/1024**3,1),
                 free_gb=round(u.free/1024**3,1), percent=u.percent))
-        except: pass
-    i['disks'] = disks; i['captured_at'] = datetime.datetime.now().isoformat()
-    return i
+        return disks
+    finally:
+        ex.shutdown(wait=False)   # abandon a hung mount rather than block
 
 # ── Thresholds + warnings ─────────────────────────────────────────────────────
 from thresholds import load_thresholds, save_thresholds, detect_thresholds
 _thresh = None
+_thresh_c = None   # flat tuple of the scalars _warnings() compares against — rebuilt on load/save/reset
+_thresh_json = b'null'   # pre-serialized GET /api/thresholds body — rebuilt alongside _thresh_c
+
+def _compile_thresholds(t=None):
+    """Flatten thresholds (default _thresh) into _thresh_c so the per-sample warning pass is plain scalar compares.
+    Everything is computed into locals first: a bad value raises before any global changes."""
+    global _thresh_c, _thresh_json, _net_base
+    t = _thresh if t is None else t
+    body = _json_bytes(t)
+    if not t: _thresh_c, _thresh_json = None, body; return
+    c, g, r, v, n = t['cpu'], t['gpu'], t['ram'], t['voltage'], t['network']
+    nb = max(1, int(n['baseline_samples']))
+    # Each metric stores (lowest alert level, crit): an idle reading clears with one compare
+    tc = (min(c['temp_warn'], c['temp_crit']),   c['temp_crit'],
+          min(g['temp_warn'], g['temp_crit']),   g['temp_crit'],
+          v['cpu_min'], v['cpu_max'],
+          min(r['usage_warn'], r['usage_crit']), r['usage_crit'],
+          min(c['usage_warn'], c['usage_crit']), c['usage_crit'],
+          min(g['usage_warn'], g['usage_crit']), g['usage_crit'],
+          max(1, c['usage_sustain_sec']//5), nb, n['spike_multiplier'])
+    if _net_base.maxlen != nb:
+        with _state_lock:
+            _net_base = deque(_net_base, maxlen=nb); _roll_sum['net'] = sum(_net_base)
+    _thresh_c, _thresh_json = tc, body
+
+def _load_thresholds():
+    """Load the saved profile into _thresh and compile it. A hand-edited leaf that is not a number
+    (null, "80", …) falls back to the detected default instead of leaving every alert disabled."""
+    global _thresh
+    cn, gn = _sysinfo.get('cpu_name',''), _sysinfo.get('gpu_name','')
+    d = detect_thresholds(cn, gn)
+    try: t = load_thresholds(PROF_DIR, cn, gn)
+    except Exception as e: _log_err('startup:thresholds', e); t = d
+    bad = []
+    for sec, vals in d.items():
+        if not isinstance(vals, dict): continue
+        if not isinstance(t.get(sec), dict): t[sec] = dict(vals); bad.append(sec); continue
+        for k, v in vals.items():
+            if type(t[sec].get(k)) not in (int, float): t[sec][k] = v; bad.append(f'{sec}.{k}')
+    if bad: _log_err('startup:thresholds', ValueError('invalid thresholds replaced by defaults: ' + ', '.join(bad)))
+    _thresh = t
+    try: _compile_thresholds()
+    except (KeyError, TypeError, ValueError) as e:
+        _log_err('startup:thresholds', e); _thresh = d; _compile_thresholds()
 
 def _warnings(cpu, gpu, ram, net):
-    w = []; t = _thresh
-    if not t: return w
+    w = []; tc = _thresh_c
+    if not tc: return w
+    (ct_lo, ct_crit, gt_lo, gt_crit, cv_min, cv_max, rp_lo, rp_crit,
+     cu_lo, cu_crit, gu_lo, gu_crit, sn, nb, spike) = tc
     ct=cpu['temp']; gt=gpu['temp']; cv=cpu.get('voltage')
     rp=ram['usage_percent']; dn=net['download_kbps']
 
-    if ct:
-        if   ct >= t['cpu']['temp_crit']: w.append(dict(id='cpu_temp_crit',level='critical',component='CPU',   message=f'CPU temp critical: {ct}°C'))
-        elif ct >= t['cpu']['temp_warn']: w.append(dict(id='cpu_temp_warn',level='warning', component='CPU',   message=f'CPU temp elevated: {ct}°C'))
-    if gt:
-        if   gt >= t['gpu']['temp_crit']: w.append(dict(id='gpu_temp_crit',level='critical',component='GPU',   message=f'GPU temp critical: {gt}°C'))
-        elif gt >= t['gpu']['temp_warn']: w.append(dict(id='gpu_temp_warn',level='warning', component='GPU',   message=f'GPU temp elevated: {gt}°C'))
-    if cv:
-        if   cv > t['voltage']['cpu_max']: w.append(dict(id='cpu_volt_high',level='critical',component='Voltage',message=f'CPU voltage high: {cv}V'))
-        elif cv < t['voltage']['cpu_min']: w.append(dict(id='cpu_volt_low', level='warning', component='Voltage',message=f'CPU voltage low: {cv}V'))
-    if   rp >= t['ram']['usage_crit']: w.append(dict(id='ram_crit',level='critical',component='RAM',message=f'RAM critical: {rp}%'))
-    elif rp >= t['ram']['usage_warn']: w.append(dict(id='ram_warn',level='warning', component='RAM',message=f'RAM high: {rp}%'))
-
-    sn = max(1, t['cpu']['usage_sustain_sec']//5)
+    if ct and ct >= ct_lo:
+        if ct >= ct_crit: w.append(dict(id='cpu_temp_crit',level='critical',component='CPU',   message=f'CPU temp critical: {ct}°C'))
+        else:             w.append(dict(id='cpu_temp_warn',level='warning', component='CPU',   message=f'CPU temp elevated: {ct}°C'))
+    if gt and gt >= gt_lo:
+        if gt >= gt_crit: w.append(dict(id='gpu_temp_crit',level='critical',component='GPU',   message=f'GPU temp critical: {gt}°C'))
+        else:             w.append(dict(id='gpu_temp_warn',level='warning', component='GPU',   message=f'GPU temp elevated: {gt}°C'))
+    if cv and not (cv_min <= cv <= cv_max):
+        if cv > cv_max:   w.append(dict(id='cpu_volt_high',level='critical',component='Voltage',message=f'CPU voltage high: {cv}V'))
+        else:             w.append(dict(id='cpu_volt_low', level='warning', component='Voltage',message=f'CPU voltage low: {cv}V'))
+    if rp >= rp_lo:
+        if rp >= rp_crit: w.append(dict(id='ram_crit',level='critical',component='RAM',message=f'RAM critical: {rp}%'))
+        else:             w.append(dict(id='ram_warn',level='warning', component='RAM',message=f'RAM high: {rp}%'))
+
     with _state_lock:
-        _sustained['cpu'].append(cpu['usage']); cs = list(_sustained['cpu'])
-        gs = None
-        if gpu['usage'] is not None: _sustained['gpu'].append(gpu['usage']); gs = list(_sustained['gpu'])
-    if len(cs) >= sn:
-        avg = sum(cs)/len(cs)
-        if   avg >= t['cpu']['usage_crit']: w.append(dict(id='cpu_sc',level='critical',component='CPU',message=f'CPU sustained {avg:.0f}%'))
-        elif avg >= t['cpu']['usage_warn']: w.append(dict(id='cpu_sw',level='warning', component='CPU',message=f'CPU sustained {avg:.0f}%'))
-    if gs and len(gs) >= sn:
-        avg = sum(gs)/len(gs)
-        if   avg >= t['gpu']['usage_crit']: w.append(dict(id='gpu_sc',level='critical',component='GPU',message=f'GPU sustained {avg:.0f}%'))
-        elif avg >= t['gpu']['usage_warn']: w.append(dict(id='gpu_sw',level='warning', component='GPU',message=f'GPU sustained {avg:.0f}%'))
-    _net_base.append(dn)
-    nb = t['network']['baseline_samples']
-    if len(_net_base) >= nb:
-        ab = sum(list(_net_base)[-nb:])/nb
-        if ab > 10 and dn > ab * t['network']['spike_multiplier']:
-            w.append(dict(id='net_spike',level='warning',component='Network',message=f'Network spike: {net["download_display"]}'))
+        _roll_push(_sustained['cpu'], 'cpu', cpu['usage']); cn = len(_sustained['cpu']); ca = _roll_sum['cpu']/cn
+        gn = 0
+        if gpu['usage'] is not None:
+            _roll_push(_sustained['gpu'], 'gpu', gpu['usage']); gn = len(_sustained['gpu']); ga = _roll_sum['gpu']/gn
+        _roll_push(_net_base, 'net', dn); nn = len(_net_base); ab = _roll_sum['net']/nn
+    if cn >= sn and ca >= cu_lo:
+        if ca >= cu_crit: w.append(dict(id='cpu_sc',level='critical',component='CPU',message=f'CPU sustained {ca:.0f}%'))
+        else:             w.append(dict(id='cpu_sw',level='warning', component='CPU',message=f'CPU sustained {ca:.0f}%'))
+    if gn >= sn and ga >= gu_lo:          # sn >= 1, so gn == 0 (no GPU reading) never gets here
+        if ga >= gu_crit: w.append(dict(id='gpu_sc',level='critical',component='GPU',message=f'GPU sustained {ga:.0f}%'))
+        else:             w.append(dict(id='gpu_sw',level='warning', component='GPU',message=f'GPU sustained {ga:.0f}%'))
+    if nn >= nb and ab > 10 and dn > ab * spike:
+        w.append(dict(id='net_spike',level='warning',component='Network',message=f'Network spike: {net["download_display"]}'))
     return w
 
 def _live_stats():
-    cpu_freq = None
-    if getattr(psutil, 'cpu_freq', None):
-        try:
-            cpu_freq = psutil.cpu_freq()
-        except Exception:
-            pass
-    ram = psutil.virtual_memory()
-    gpu = get_gpu_cached(); net = _net_speed()
-    ct, cv = get_cpu_temp_voltage(); ts = time.time()
+    ram = _vmem(); net = _net_speed()    # the two live psutil reads, back to back
+    gpu = get_gpu_cached()
+    h = _hw_cache                        # one consistent snapshot, no lock
+    ct, cv      = h['cpu_temp'], h['cpu_volt']
+    lhm_running = h['lhm_running']
+    fan_rpms    = h['lhm_fans']
+    ts = time.time()
     cpu = dict(usage=round(_cpu_cache,1), temp=ct, voltage=cv,
-               freq_ghz=round(cpu_freq.current/1000,2) if cpu_freq else None,
-               cores=psutil.cpu_count(logical=False), threads=psutil.cpu_count(logical=True))
+               freq_ghz=_cpu_freq_ghz,
+               cores=_CPU_CORES, threads=_CPU_THREADS)
     r   = dict(usage_percent=round(ram.percent,1), used_gb=round(ram.used/1024**3,2),
-               total_gb=round(ram.total/1024**3,2), available_gb=round(ram.available/1024**3,2))
+               total_gb=_RAM_TOTAL_GB, available_gb=round(ram.available/1024**3,2))
     warns = _warnings(cpu, gpu, r, net)
     with _state_lock:
         for k,v in (('timestamps',round(ts)),('cpu_usage',_cpu_cache),('cpu_temp',ct),
                     ('gpu_usage',gpu['usage']),('gpu_temp',gpu['temp']),('ram_usage',ram.percent),
                     ('net_down',net['download_kbps']),('net_up',net['upload_kbps'])):
             history[k].append(v)
+        # The copy is the thread-safety boundary: jsonify runs outside _state_lock while other
+        # requests append. /api/stats reuses one sample per STATS_MIN_INTERVAL, so it's made once.
         hist = {k: list(v) for k,v in history.items()}
-    with _hw_lock:
-        lhm_running = _hw_cache['lhm_running']
-        fan_rpms    = list(_hw_cache['lhm_fans'])
     return dict(cpu=cpu, ram=r, gpu=gpu, network=net, warnings=warns, history=hist,
                 timestamp=ts, lhm_running=lhm_running, fan_rpms=fan_rpms)
 
 # ── Log flush ─────────────────────────────────────────────────────────────────
+LOG_FLUSH_SECS = 60
+_log_wake      = threading.Event()   # set to force an early flush from the writer thread
+
 def _log_stats(s):
-    global _log_ts
+    # Request threads only append — file I/O happens on _log_writer, never in /api/stats
     with _log_lock:
         _log_buffer.append(dict(ts=s['timestamp'],cpu=s['cpu'],ram=s['ram'],gpu=s['gpu'],warnings=s['warnings']))
-        flush = time.time()-_log_ts >= 60
-    if flush: _flush_log()
+
+_session_f    = (None, None)   # (date, unbuffered append handle) — reopened on day rollover or if the file was deleted
+_session_lock = threading.Lock()
+
+def _session_log_file():
+    """Append handle for today's session log; caller holds _session_lock."""
+    global _session_f
+    d = datetime.date.today()
+    if d == _session_f[0] and os.fstat(_session_f[1].fileno()).st_nlink == 0:
+        _session_close()   # unlinked under us (logs/ cleared): writes would succeed into an orphaned inode
+    if d != _session_f[0]:
+        rolled = _session_f[0] is not None
+        _session_close()
+        os.makedirs(LOG_DIR, exist_ok=True)
+        path = os.path.join(LOG_DIR, f"session_{d.isoformat()}.jsonl")
+        _session_f = (d, open(path, 'ab', buffering=0))
+        if rolled: threading.Thread(target=_compress_old_sessions, daemon=True).start()
+    return _session_f[1]
+
+def _session_close():
+    global _session_f
+    if _session_f[1]:
+        try: _session_f[1].close()
+        except OSError: pass
+    _session_f = (None, None)
+
+def _compress_old_sessions():
+    """Gzip session logs from earlier days (repetitive JSONL snapshots shrink ~10x). Today's file
+    stays plain for appends. Runs in a daemon thread at startup and on each day rollover."""
+    import gzip, shutil
+    today = f"session_{datetime.date.today().isoformat()}.jsonl"
+    try: names = os.listdir(LOG_DIR)
+    except OSError: return
+    for n in names:
+        if not (n.startswith('session_') and n.endswith('.jsonl')) or n >= today: continue
+        p = os.path.join(LOG_DIR, n); tmp = p + '.gz.tmp'
+        try:
+            with open(p, 'rb') as src, gzip.open(tmp, 'wb', compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1 << 20)
+            os.replace(tmp, p + '.gz'); os.unlink(p)   # the .gz is complete before the original goes
+        except OSError:
+            try: os.unlink(tmp)
+            except OSError: pass
 
 def _flush_log():
-    global _log_ts
     with _log_lock:
         if not _log_buffer: return
-        es, _log_buffer[:] = list(_log_buffer), []; _log_ts = time.time()
+        es, _log_buffer[:] = list(_log_buffer), []
     try:
-        with open(os.path.join(LOG_DIR, f"session_{datetime.date.today().isoformat()}.jsonl"),'a',encoding='utf-8') as f:
-            for e in es: f.write(json.dumps(e)+'\n')
+        data = _jsonl_bytes(es)
+        with _session_lock:
+            # Unbuffered: the batch is already one bytes object, so it goes straight to a single write(2)
+            try: _session_log_file().write(data)
+            except Exception: _session_close(); raise   # reopen on the next flush
     except Exception as e: print(f'  [WARN] Log flush: {e}')
 
+def _log_writer():
+    """Background: drain _log_buffer to today's session file every LOG_FLUSH_SECS."""
+    while True:
+        _log_wake.wait(LOG_FLUSH_SECS); _log_wake.clear()
+        _flush_log()
+
+threading.Thread(target=_log_writer, daemon=True).start()
+threading.Thread(target=_compress_old_sessions, daemon=True).start()
+
 # ── Profiles ──────────────────────────────────────────────────────────────────
 def _save_orig(si):
     if os.path.exists(ORIG_PROFILE_FILE): return
@@ -1338,12 +1695,12 @@ if _sysinfo: print(f'  [OK] {_sysinfo.get("cpu_name","?")} | {_os_class()}')
 else: print('  [WARN] Hardware scan timed out — continuing with partial data')
 
 print('  Loading thresholds...')
-try:    _thresh = load_thresholds(PROF_DIR, _sysinfo.get('cpu_name',''), _sysinfo.get('gpu_name','')); print('  [OK] Thresholds ready')
+try:    _load_thresholds(); print('  [OK] Thresholds ready')
 except Exception as e: _log_err('startup:thresholds', e); print(f'  [WARN] {e}')
 
 _save_orig(_sysinfo)
 print('  Warming CPU sampler...')
-time.sleep(1.2)
+_cpu_ready.wait(timeout=2.0)   # usually already set — the sampler ran during the hardware scan
 try:    _init = _live_stats(); _save_baseline(_sysinfo, _init)
 except Exception as e: _log_err('startup:live_stats', e)
 
@@ -1351,8 +1708,26 @@ _track('installed' if _is_new else 'launch')
 _update_launch(success=True)
 
 import atexit
+atexit.register(_append_close)   # registered first so it runs after the flushes below
 atexit.register(_flush_log); atexit.register(_flush_errs)
 
+# Static JSON bodies serialized once instead of per request
+_sysinfo_json = _json_bytes(_sysinfo)
+_version_json = _json_bytes(dict(version=VER, platform=sys.platform, update_check_url=UPDATE_CHECK_URL))
+_file_json    = {}   # path -> ((mtime_ns, size), body) for profile files served verbatim
+
+def _json_body(body):
+    return Response(body, mimetype='application/json')
+
+def _json_file(path):
+    """Serialized contents of a JSON profile file, re-read only when the file changes."""
+    st  = os.stat(path); key = (st.st_mtime_ns, st.st_size)
+    hit = _file_json.get(path)
+    if hit and hit[0] == key: return hit[1]
+    with open(path, encoding='utf-8') as f: body = _json_bytes(json.load(f))
+    _file_json[path] = (key, body)
+    return body
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ROUTES
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1364,17 +1739,35 @@ def serve_asset(filename):
     return send_from_directory(os.path.join(ASSET_DIR, 'assets'), filename)
 
 @app.route('/api/system')
-def api_system():   return jsonify(_sysinfo)
+def api_system():   return _json_body(_sysinfo_json)
+
+def _stats_delta(s, since):
+    """Sample with only the history points newer than `since`. history_start (the oldest point the
+    server still holds) tells the client what to trim; it is omitted when `since` is ahead of the
+    newest point (clock went backwards) so the client replaces its copy with the full window."""
+    h = s['history']; ts = h['timestamps']
+    if ts and since > ts[-1]: return s
+    i = bisect.bisect_right(ts, since)
+    return dict(s, history={k: v[i:] for k, v in h.items()}, history_start=ts[0] if ts else None)
 
 @app.route('/api/stats')
 def api_stats():
     g = _guard()
     if g: return g
-    try:    s = _live_stats(); _log_stats(s); return jsonify(s)
+    global _stats_cache
+    try:
+        c = _stats_cache
+        # Several tabs/clients polling at once share one sample (and its encoded body) instead of
+        # each re-reading psutil and re-serializing the history arrays
+        if c is None or time.time() - c[0]['timestamp'] >= STATS_MIN_INTERVAL:
+            s = _live_stats(); c = _stats_cache = (s, _json_bytes(s)); _log_stats(s)
+        since = request.args.get('since', type=float)
+        if since is None: return _json_body(c[1])
+        return _json_body(_json_bytes(_stats_delta(c[0], since)))
     except Exception as e: _log_err('api_stats', e); return jsonify(error='stats failed'), 500
 
 @app.route('/api/thresholds', methods=['GET'])
-def api_thresholds_get(): return jsonify(_thresh)
+def api_thresholds_get(): return _json_body(_thresh_json)
 
 @app.route('/api/thresholds', methods=['POST'])
 def api_thresholds_post():
@@ -1383,54 +1776,83 @@ def api_thresholds_post():
     if not d: return jsonify(error='No data'), 400
     ok, e = _validate(d)
     if not ok: return jsonify(error=e), 400
-    for k,v in d.items():
-        if k in ALLOWED_THRESHOLD_KEYS and isinstance(v, dict): _thresh[k].update(v)
-    save_thresholds(PROF_DIR, _thresh)
+    upd = {k: v for k,v in d.items() if k in ALLOWED_THRESHOLD_KEYS and isinstance(v, dict)}
+    for k,v in upd.items():
+        for kk,x in v.items():
+            if type(x) not in (int, float): return jsonify(error=f'Threshold {k}.{kk} must be a number'), 400
+    # Apply to a copy and swap it in only once it compiles — a failed POST leaves nothing half-applied
+    t = {k: dict(v) if isinstance(v, dict) else v for k,v in _thresh.items()}
+    for k,v in upd.items(): t.setdefault(k, {}).update(v)
+    try: _compile_thresholds(t)
+    except (KeyError, TypeError, ValueError) as e: return jsonify(error=f'Invalid thresholds: {e}'), 400
+    _thresh = t; save_thresholds(PROF_DIR, _thresh)
     return jsonify(status='saved', thresholds=_thresh)
 
 @app.route('/api/thresholds/reset', methods=['POST'])
 def api_thresholds_reset():
     global _thresh
-    _thresh = detect_thresholds(_sysinfo.get('cpu_name',''), _sysinfo.get('gpu_name',''))
+    _thresh = detect_thresholds(_sysinfo.get('cpu_name',''), _sysinfo.get('gpu_name','')); _compile_thresholds()
     save_thresholds(PROF_DIR, _thresh); return jsonify(status='reset', thresholds=_thresh)
 
 @app.route('/api/baseline')
 def api_baseline():
-    return jsonify(json.load(open(BASELINE,encoding='utf-8'))) if os.path.exists(BASELINE) \
-           else (jsonify(error='No baseline'), 404)
+    try: return _json_body(_json_file(BASELINE))   # _json_file's stat doubles as the existence check
+    except FileNotFoundError: return jsonify(error='No baseline'), 404
 
 @app.route('/api/original_profile')
 def api_orig_profile():
-    return jsonify(json.load(open(ORIG_PROFILE_FILE,encoding='utf-8'))) if os.path.exists(ORIG_PROFILE_FILE) \
-           else (jsonify(error='No profile'), 404)
+    try: return _json_body(_json_file(ORIG_PROFILE_FILE))
+    except FileNotFoundError: return jsonify(error='No profile'), 404
 
 @app.route('/api/version')
 def api_version():
-    return jsonify(version=VER, platform=sys.platform, update_check_url=UPDATE_CHECK_URL)
+    return _json_body(_version_json)
+
+_tail_cache, _tail_lock = {}, threading.Lock()   # path -> [offset, count, first, deque of recent entries]
+
+def _jsonl_tail(path, keep=20):
+    """(count, first, recent) for an append-only JSONL log. Only bytes appended since the last
+    call are parsed, a line at a time (memory stays flat even on a multi-MB backlog after a restart);
+    a shrunk or missing file (cleared logs) starts the scan over."""
+    with _tail_lock:
+        t = _tail_cache.get(path)
+        try: size = os.path.getsize(path)
+        except OSError: size = 0
+        if t is None or size < t[0]:
+            t = _tail_cache[path] = [0, 0, None, deque(maxlen=keep)]
+        if size > t[0]:
+            with open(path, 'rb') as f:
+                f.seek(t[0])
+                for ln in f:
+                    if not ln.endswith(b'\n'): break   # leave a half-written last line for next time
+                    t[0] += len(ln)
+                    try: e = json.loads(ln)
+                    except: continue
+                    if t[2] is None: t[2] = e
+                    t[1] += 1; t[3].append(e)
+        return t[1], t[2], list(t[3])
 
 @app.route('/api/telemetry')
 def api_telemetry():
-    tf = os.path.join(PROF_DIR,'telemetry.jsonl'); sf = os.path.join(PROF_DIR,'launch_stats.json')
-    evs = []
-    if os.path.exists(tf):
-        with open(tf,encoding='utf-8') as f:
-            for ln in f:
-                try: evs.append(json.loads(ln))
-                except: pass
-    ls = json.load(open(sf,encoding='utf-8')) if os.path.exists(sf) else {}
+    sf = os.path.join(PROF_DIR,'launch_stats.json')
+    n, _, recent = _jsonl_tail(os.path.join(PROF_DIR,'telemetry.jsonl'))
+    try:
+        with open(sf,encoding='utf-8') as f: ls = json.load(f)
+    except FileNotFoundError: ls = {}
     return jsonify(install_id=_install_id, is_new=_is_new, launch_stats=ls,
-                   event_count=len(evs), recent=evs[-10:])
+                   event_count=n, recent=recent[-10:])
 
 @app.route('/api/errors')
 def api_errors():
-    ef = os.path.join(LOG_DIR,'errors.jsonl'); es = []
-    if os.path.exists(ef):
-        with open(ef,encoding='utf-8') as f:
-            for ln in f:
-                try: es.append(json.loads(ln))
-                except: pass
-    return jsonify(count=len(es), first=es[0]['date'] if es else None,
-                   last=es[-1]['date'] if es else None, recent=es[-20:])
+    n, first, recent = _jsonl_tail(os.path.join(LOG_DIR,'errors.jsonl'))
+    return jsonify(count=n, first=first['date'] if first else None,
+                   last=recent[-1]['date'] if recent else None, recent=recent)
+
+# Feedback triage keywords, one compiled alternation per bucket (single C-level scan per message)
+def _kw_rx(*ks): return re.compile('|'.join(map(re.escape, ks)))
+_RX_BUG_CRIT = _kw_rx('crash','freeze','not working','broken','error','exception',"won't start",'fails')
+_RX_BUG_HIGH = _kw_rx('wrong','incorrect','missing','n/a','not showing','blank','stuck')
+_RX_PERF     = _kw_rx('slow','lag','freeze','high cpu','100%')
 
 @app.route('/api/feedback', methods=['POST'])
 def api_feedback():
@@ -1448,13 +1870,13 @@ def api_feedback():
     pri, act = 'normal', None
     kw = msg.lower()
     if cat == 'bug':
-        if any(k in kw for k in ('crash','freeze','not working','broken','error','exception',"won't start",'fails')):
+        if _RX_BUG_CRIT.search(kw):
             pri, act = 'critical', 'immediate_fix'
-        elif any(k in kw for k in ('wrong','incorrect','missing','n/a','not showing','blank','stuck')):
+        elif _RX_BUG_HIGH.search(kw):
             pri, act = 'high', 'fix_next_build'
         else: pri, act = 'normal', 'fix_next_build'
     elif cat == 'performance':
-        pri, act = ('high','investigate_immediately') if any(k in kw for k in ('slow','lag','freeze','high cpu','100%')) \
+        pri, act = ('high','investigate_immediately') if _RX_PERF.search(kw) \
                    else ('normal','investigate_next_build')
     elif cat == 'feature':  pri, act = 'review', 'pending_review'
     else:                   pri, act = 'low', 'log_only'
@@ -1465,32 +1887,47 @@ def api_feedback():
                  sys_info=dict(cpu=_cpu_class(_sysinfo.get('cpu_name','')),
                                gpu=_gpu_class(_sysinfo.get('gpu_name','N/A')),
                                os=_os_class(), platform=sys.platform))
-    fd = os.path.join(LOG_DIR,'feedback'); os.makedirs(fd, exist_ok=True)
     try:
-        with open(os.path.join(fd,f'{cat}.jsonl'),'a',encoding='utf-8') as f:
-            f.write(json.dumps(entry)+'\n')
+        _append(_FB_FILES[cat], _jsonl_bytes((entry,)))
         msgs = dict(critical='Critical bug logged -- fix queued immediately',
                     high='Bug logged -- next build', review="Feature logged -- we'll review!",
                     normal='Logged -- thank you!', low='Feedback received -- thank you!')
         return jsonify(status='ok', id=entry['id'], priority=pri, message=msgs.get(pri,'Thank you!'))
     except Exception as e: _log_err('api_feedback', e); return jsonify(error=str(e)), 500
 
+_fb_open_cache = {}   # path -> ((mtime_ns, size), open entries)
+_FB_CATS      = ('bug','performance','feature','general')
+_FB_FILES     = {c: os.path.join(FEEDBACK_DIR, f'{c}.jsonl') for c in _FB_CATS}
+_FB_PRI_RANK  = {'critical':0,'high':1,'review':2,'normal':3,'low':4}
+
+def _fb_rank(e): return _FB_PRI_RANK.get(e.get('priority','low'),5)
+
+def _fb_open_items(fp):
+    """Open entries in one feedback jsonl file, most urgent first; re-parsed only when the file changes."""
+    st  = os.stat(fp); key = (st.st_mtime_ns, st.st_size)   # FileNotFoundError -> caller skips the category
+    hit = _fb_open_cache.get(fp)
+    if hit and hit[0] == key: return hit[1]
+    items = []
+    with open(fp,encoding='utf-8') as fh:
+        for ln in fh:
+            if '"open"' not in ln: continue   # can't be status=open — skip json.loads
+            try:
+                e = json.loads(ln)
+                if e.get('status') == 'open': items.append(e)
+            except: pass
+    items.sort(key=_fb_rank)   # stable: file order within a priority
+    _fb_open_cache[fp] = (key, items)
+    return items
+
 @app.route('/api/feedback/queue')
 def api_feedback_queue():
-    fd = os.path.join(LOG_DIR,'feedback')
-    if not os.path.exists(fd): return jsonify(items=[], counts={})
-    items, counts = [], {c:0 for c in ('bug','performance','feature','general')}
-    for cat in counts:
-        fp = os.path.join(fd, f'{cat}.jsonl')
-        if os.path.exists(fp):
-            with open(fp,encoding='utf-8') as fh:
-                for ln in fh:
-                    try:
-                        e = json.loads(ln)
-                        if e.get('status') == 'open': items.append(e); counts[cat] += 1
-                    except: pass
-    items.sort(key=lambda x: {'critical':0,'high':1,'review':2,'normal':3,'low':4}.get(x.get('priority','low'),5))
-    return jsonify(items=items[-50:], counts=counts)
+    lists, counts = [], dict.fromkeys(_FB_CATS, 0)
+    for cat in _FB_CATS:
+        try: es = _fb_open_items(_FB_FILES[cat])
+        except FileNotFoundError: continue
+        lists.append(es); counts[cat] = len(es)
+    # Categories are cached pre-sorted, so the 50 most urgent come from a lazy merge — no full sort
+    return jsonify(items=list(islice(heapq.merge(*lists, key=_fb_rank), 50)), counts=counts)
 
 @app.route('/api/shutdown', methods=['POST'])
 def api_shutdown():
@@ -1575,7 +2012,7 @@ def api_autofix():
 
 @app.route('/api/fps')
 def api_fps():
-    with _fps_lock: return jsonify(dict(_fps_cache))
+    return _json_body(_json_bytes(_fps_cache))   # polled every 2s by the dashboard
 
 @app.route('/api/forge/fan_curves')
 def api_forge_fan_curves():
@@ -1716,33 +2153,34 @@ def api_forge_benchmark():
 
 @app.route('/api/forge/benchmark/status')
 def api_forge_benchmark_status():
-    with _bench_lock:
-        return jsonify(dict(_bench_status))
+    with _bench_lock: body = _json_bytes(_bench_status)   # polled every 2s while a run is active
+    return _json_body(body)
 
 @app.route('/api/forge/benchmark/history')
 def api_forge_benchmark_history():
     runs = []
-    if os.path.exists(BENCH_FILE):
+    try:
         with open(BENCH_FILE, encoding='utf-8') as f:
             for ln in f:
                 try: runs.append(json.loads(ln))
                 except: pass
+    except FileNotFoundError: pass
     return jsonify(runs=list(reversed(runs[-20:])))  # last 20, newest first
 
 @app.route('/api/forge/benchmark/baseline')
 def api_forge_benchmark_baseline():
     _no_data = jsonify(status='no_data', message='No baseline yet — run your first benchmark!')
-    if not os.path.exists(BENCH_FILE):
-        return _no_data
     # Return first run tagged as baseline, fall back to first run
     first = None
-    with open(BENCH_FILE, encoding='utf-8') as f:
-        for ln in f:
-            try:
-                r = json.loads(ln)
-                if first is None: first = r
-                if r.get('baseline'): return jsonify(r)
-            except: pass
+    try:
+        with open(BENCH_FILE, encoding='utf-8') as f:
+            for ln in f:
+                try:
+                    r = json.loads(ln)
+                    if first is None: first = r
+                    if r.get('baseline'): return jsonify(r)
+                except: pass
+    except FileNotFoundError: pass
     return jsonify(first) if first else _no_data
 
 
@@ -1781,10 +2219,9 @@ def _eve_sapi_pitch(hz):
 def _eve_voice_enabled():
     """Return True if Eve's voice is on (default)."""
     try:
-        if os.path.exists(ACCESSIBILITY_FILE):
-            prof = json.load(open(ACCESSIBILITY_FILE, encoding='utf-8'))
-            return bool(prof.get('eve_voice', True))
-    except Exception:
+        with open(ACCESSIBILITY_FILE, encoding='utf-8') as f: prof = json.load(f)
+        return bool(prof.get('eve_voice', True))
+    except Exception:   # incl. FileNotFoundError — no profile yet means the default
         pass
     return True
 
@@ -1828,9 +2265,8 @@ def _eve_speak_async(message, hz=None, force=False):
 def api_eve_voice_get():
     """Return current eve_voice setting (default True)."""
     try:
-        if os.path.exists(ACCESSIBILITY_FILE):
-            prof = json.load(open(ACCESSIBILITY_FILE, encoding='utf-8'))
-            return jsonify(eve_voice=bool(prof.get('eve_voice', True)))
+        with open(ACCESSIBILITY_FILE, encoding='utf-8') as f: prof = json.load(f)
+        return jsonify(eve_voice=bool(prof.get('eve_voice', True)))
     except Exception:
         pass
     return jsonify(eve_voice=True)
@@ -1930,9 +2366,7 @@ def api_eve_jserror():
         'page':    str(d.get('page', ''))[:200],
     }
     try:
-        js_log = os.path.join(LOG_DIR, 'jserrors.jsonl')
-        with open(js_log, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(entry) + '\n')
+        _append(os.path.join(LOG_DIR, 'jserrors.jsonl'), _jsonl_bytes((entry,)))
     except Exception as e:
         _log_err('api_eve_jserror', e)
     return jsonify(ok=True)
@@ -1972,8 +2406,8 @@ def _download_update(url):
 
 @app.route('/api/update/status')
 def api_update_status():
-    with _update_lock:
-        return jsonify(**_update_state)
+    with _update_lock: body = _json_bytes(_update_state)   # polled every 600ms during a download
+    return _json_body(body)
 
 @app.route('/api/update/download', methods=['POST'])
 def api_update_download():
@@ -2057,10 +2491,9 @@ def api_update_install():
 @app.route('/api/lhm/status')
 def api_lhm_status():
     prefs = {}
-    if os.path.exists(PREF_FILE):
-        try:
-            with open(PREF_FILE, encoding='utf-8') as f: prefs = json.load(f)
-        except: pass
+    try:
+        with open(PREF_FILE, encoding='utf-8') as f: prefs = json.load(f)
+    except: pass
     with _lhm_lock:
         inst_state    = _lhm_state.get('state', 'idle')
         inst_progress = _lhm_state.get('progress', 0)
@@ -2160,20 +2593,18 @@ def api_lhm_install():
 @app.route('/api/lhm/check', methods=['POST'])
 def api_lhm_check():
     lhm = _lhm_read_sensors()
-    with _hw_lock:
-        _hw_cache.update(lhm_running=lhm['available'], lhm_fans=lhm['fans'])
+    _hw_publish(lhm_running=lhm['available'], lhm_fans=lhm['fans'])
     return jsonify(lhm_running=lhm['available'], na_count=_count_na_sensors())
 
 @app.route('/api/preferences', methods=['GET', 'POST'])
 def api_preferences():
     """Read/write user preferences (temp_unit, dark_mode) to profiles/preferences.json."""
     if request.method == 'GET':
-        if os.path.exists(PREF_FILE):
-            try:
-                with open(PREF_FILE, encoding='utf-8') as f:
-                    return jsonify(json.load(f))
-            except Exception:
-                pass
+        try:
+            with open(PREF_FILE, encoding='utf-8') as f:
+                return jsonify(json.load(f))
+        except Exception:
+            pass
         return jsonify(temp_unit='F', dark_mode=False)
     d = request.get_json(silent=True) or {}
     prefs = {}
@@ -2517,27 +2948,40 @@ def api_forge_benchmark_gpu_status():
 @app.route('/api/forge/benchmark/gpu/history')
 def api_forge_benchmark_gpu_history():
     runs = []
-    if os.path.exists(GPU_BENCH_FILE):
+    try:
         with open(GPU_BENCH_FILE, encoding='utf-8') as f:
             for ln in f:
                 try: runs.append(json.loads(ln))
                 except: pass
+    except FileNotFoundError: pass
     return jsonify(runs=list(reversed(runs[-10:])))
 
 
+def run_server(port, dev=False):
+    """Serve the app on 0.0.0.0:port. waitress (fixed thread pool) when installed;
+    the Werkzeug dev server when it isn't, or when dev=True (--dev) for debugging."""
+    if _waitress and not dev:
+        # channel_timeout: reap keep-alive sockets left idle by closed dashboard tabs after 30 s
+        _waitress.serve(app, host='0.0.0.0', port=port, threads=4, connection_limit=100,
+                        channel_timeout=30)
+    else:
+        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False, threaded=True)
+
+
 if __name__ == '__main__':
     port = 5000
-    if len(sys.argv) > 1:
+    args = [a for a in sys.argv[1:] if a != '--dev']
+    if args:
         try:
-            port = int(sys.argv[1])
+            port = int(args[0])
             if port < 1 or port > 65535:
                 raise ValueError('port out of range')
         except (ValueError, TypeError):
-            print('  Usage: python server.py [PORT]  (default: 5000)')
+            print('  Usage: python server.py [PORT] [--dev]  (default: 5000)')
             sys.exit(1)
     print(f'\n  KAM SENTINEL v{VER}  [{sys.platform}]')
     print(f'  http://localhost:{port}')
     if not _GPU: print('  [!] pip install GPUtil  for GPU stats')
     if sys.platform == 'win32' and not _WMI: print('  [!] pip install wmi pywin32  for full Windows data')
     print()
-    app.run(host='0.0.0.0', port=port, debug=False, threaded=True)
+    run_server(port, dev='--dev' in sys.argv)
@@ -22,7 +22,7 @@ echo  [OK] Python found
 echo  [..] Installing required packages...
 echo.
 
-pip install flask psutil GPUtil wmi pywin32 --quiet
+pip install flask psutil GPUtil wmi pywin32 waitress --quiet
 
 if errorlevel 1 (
     echo.
@@ -27,6 +27,10 @@ pip3 install --user flask psutil
 
 # Optional: GPU monitoring (nvidia-smi on Linux; less relevant on macOS but harmless)
 pip3 install --user GPUtil 2>/dev/null || echo "  [WARN] GPUtil optional - GPU may show N/A"
+# Optional: production WSGI server (falls back to the Flask dev server)
+pip3 install --user waitress 2>/dev/null || echo "  [WARN] waitress optional - using Flask dev server"
+# Optional: faster JSON encoding for session logs
+pip3 install --user orjson 2>/dev/null || echo "  [WARN] orjson optional - falls back to stdlib json"
 
 echo ""
 echo "  [..] Creating directories..."
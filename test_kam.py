@@ -801,7 +801,7 @@ try:
     import time as _rl_time
     test_ip = '10.99.88.77'
     with srv._rl_lock:
-        srv._rl[test_ip] = [_rl_time.time()] * srv.RL_MAX
+        srv._rl[test_ip] = srv.deque([_rl_time.time()] * srv.RL_MAX, maxlen=srv.RL_MAX)
     resp = client.get('/api/stats', environ_base={'REMOTE_ADDR': test_ip})
     if resp.status_code == 429:
         ok(f"Rate limiting triggered at request {srv.RL_MAX + 1} -> 429")
@@ -1927,6 +1927,604 @@ for _selector, _label in _html19_checks:
     else:
         fail(f"dashboard.html: {_label} -- not found")
 
+# ── §20. Hot Path & I/O Performance ──────────────────────────────────────────
+section("20. Hot Path & I/O Performance")
+
+_root20 = os.path.dirname(os.path.abspath(__file__))
+
+# -- BugWatcher: post-resolve test runs are batched + off the poll path --------
+try:
+    import importlib.util as _ilu20, tempfile as _tf20
+    _spec20 = _ilu20.spec_from_file_location('bugwatcher20', os.path.join(_root20, 'scripts', 'bugwatcher.py'))
+    _bw20   = _ilu20.module_from_spec(_spec20)
+    _spec20.loader.exec_module(_bw20)
+
+    with _tf20.TemporaryDirectory() as _td20:
+        _bw20.FEEDBACK_BUG_FILE = os.path.join(_td20, 'bug.jsonl')
+        _bw20.WATCHER_LOG       = os.path.join(_td20, 'bugwatcher.jsonl')
+        with open(_bw20.FEEDBACK_BUG_FILE, 'w', encoding='utf-8') as _f:
+            for _bid in ('BUG-1', 'BUG-2', 'BUG-3'):
+                _f.write(json.dumps({'id': _bid, 'status': 'resolved'}) + '\n')
+        _calls20 = []
+        _bw20._run_tests = lambda: (_calls20.append(1), time.sleep(0.05), 79)[-1]
+        _t0_20 = time.perf_counter()
+        _bw20._schedule_tests(['BUG-1', 'BUG-2', 'BUG-3'])
+        _sched_ms20 = (time.perf_counter() - _t0_20) * 1000
+        _fut20 = _bw20._test_future
+        if _fut20 is not None:
+            _fut20.result(timeout=10)
+        with open(_bw20.FEEDBACK_BUG_FILE, encoding='utf-8') as _f:
+            _stamped20 = [json.loads(l).get('tests_passing') for l in _f if l.strip()]
+        if _sched_ms20 < 250:
+            ok(f"bugwatcher: _schedule_tests() returns in {_sched_ms20:.1f}ms -- poll loop never waits on the suite")
+        else:
+            fail(f"bugwatcher: _schedule_tests() took {_sched_ms20:.1f}ms -- test run is blocking the poll loop")
+        if len(_calls20) == 1 and _stamped20 == [79, 79, 79]:
+            ok("bugwatcher: 3 critical bugs -> 1 test run, tests_passing stamped on each")
+        else:
+            fail(f"bugwatcher: expected 1 run stamping 3 bugs, got runs={len(_calls20)} stamped={_stamped20}")
+        # Append logs go through cached O_APPEND fds -- one complete line per entry
+        _bw20._log('BUG-9', 'probe', 'fd reuse')
+        _nfds20 = len(_bw20._append_fds)
+        _bw20._close_append_fds()   # release before the temp dir is removed (Windows)
+        with open(_bw20.WATCHER_LOG, encoding='utf-8') as _f:
+            _wl20 = [json.loads(l) for l in _f if l.strip()]
+        if _nfds20 == 1 and [e['bug_id'] for e in _wl20] == ['BUG-1', 'BUG-2', 'BUG-3', 'BUG-9']:
+            ok("bugwatcher: _log() appends via one cached fd -- 4 intact JSONL entries")
+        else:
+            fail(f"bugwatcher: append log mismatch fds={_nfds20} entries={[e.get('bug_id') for e in _wl20]}")
+        # A batch whose bookkeeping raises must not wedge the worker for every later run
+        _upd20 = _bw20._update_bug_in_file
+        _bw20._update_bug_in_file = lambda *a: 1 / 0
+        _bw20._schedule_tests(['BUG-1'])
+        if _bw20._test_future is not None:
+            _bw20._test_future.result(timeout=10)
+        _bw20._update_bug_in_file = _upd20
+        _idle20 = _bw20._test_future is None
+        _bw20._schedule_tests(['BUG-2'])
+        if _bw20._test_future is not None:
+            _bw20._test_future.result(timeout=10)
+        if _idle20 and len(_calls20) == 3:
+            ok("bugwatcher: failed stamp logged, worker disarmed -- the next batch still runs")
+        else:
+            fail(f"bugwatcher: worker stuck after failed batch (idle={_idle20}, runs={len(_calls20)})")
+        # Readers share _bug_file_lock with the worker's truncate+rewrite -- never see a half-written file
+        _got20 = []
+        with _bw20._bug_file_lock:
+            _rd20 = threading.Thread(target=lambda: _got20.append(len(_bw20._load_open_bugs())))
+            _rd20.start(); _rd20.join(0.2)
+            _blocked20 = _rd20.is_alive()
+        _rd20.join(5)
+        if _blocked20 and _got20:
+            ok("bugwatcher: _load_open_bugs() waits on _bug_file_lock while bug.jsonl is being rewritten")
+        else:
+            fail(f"bugwatcher: _load_open_bugs() read bug.jsonl without the lock (blocked={_blocked20})")
+        _bw20._close_append_fds()
+except Exception as _e20bw:
+    fail(f"§20 bugwatcher test-run batching error: {_e20bw}")
+
+# -- server: thresholds compiled to flat scalars, recompiled on POST -----------
+try:
+    import server as _srv20, copy as _copy20, tempfile as _tf20th
+    _saved20 = _copy20.deepcopy(_srv20._thresh)
+    _prof20 = _srv20.PROF_DIR
+    _td20th = _tf20th.TemporaryDirectory()
+    _srv20.PROF_DIR = _td20th.name   # the POSTs below save thresholds -- never onto the real profile
+    try:
+        _cpu20 = dict(temp=60, usage=10, voltage=None)
+        _gpu20 = dict(temp=None, usage=None)
+        _ram20 = dict(usage_percent=10)
+        _net20 = dict(download_kbps=0, download_display='0 KB/s')
+        if isinstance(_srv20._thresh_c, tuple):
+            ok("server: _thresh_c compiled at startup -- _warnings() skips nested dict lookups")
+        else:
+            fail(f"server: _thresh_c not compiled at startup: {_srv20._thresh_c!r}")
+        _r20 = _srv20.app.test_client().post('/api/thresholds', json={'cpu': {'temp_crit': 55, 'temp_warn': 50}})
+        _ids20 = [w['id'] for w in _srv20._warnings(_cpu20, _gpu20, _ram20, _net20)]
+        if _r20.status_code == 200 and 'cpu_temp_crit' in _ids20:
+            ok("server: POST /api/thresholds recompiles -- 60C fires cpu_temp_crit at new 55C limit")
+        else:
+            fail(f"server: thresholds not recompiled after POST (status={_r20.status_code}, ids={_ids20})")
+        _g20 = _srv20.app.test_client().get('/api/thresholds')
+        if _g20.is_json and (_g20.get_json() or {}).get('cpu', {}).get('temp_crit') == 55:
+            ok("server: pre-serialized GET /api/thresholds body refreshed by POST")
+        else:
+            fail(f"server: GET /api/thresholds stale after POST: {_g20.get_data()[:120]!r}")
+        _sy20 = _srv20.app.test_client().get('/api/system')
+        if _sy20.status_code == 200 and _sy20.is_json and _sy20.get_json() == json.loads(json.dumps(_srv20._sysinfo)):
+            ok("server: /api/system served from startup-serialized bytes")
+        else:
+            fail(f"server: /api/system body mismatch (status={_sy20.status_code})")
+        # Idle sample clears every section; warn vs crit still split correctly
+        _srv20._thresh = _copy20.deepcopy(_saved20); _srv20._compile_thresholds()
+        _t20 = _srv20._thresh
+        _idle20 = _srv20._warnings(dict(_cpu20, temp=30, voltage=1.2), dict(_gpu20, temp=40), _ram20, _net20)
+        _wv20   = _srv20._warnings(dict(_cpu20, temp=_t20['cpu']['temp_warn'], voltage=_t20['voltage']['cpu_min'] - 0.1),
+                                   _gpu20, dict(_ram20, usage_percent=_t20['ram']['usage_crit']), _net20)
+        _wv20 = sorted(w['id'] for w in _wv20)
+        if not _idle20 and _wv20 == ['cpu_temp_warn', 'cpu_volt_low', 'ram_crit']:
+            ok("server: idle sample -> no warnings; warn/crit/voltage-range boundaries unchanged")
+        else:
+            fail(f"server: warning fast-path mismatch idle={_idle20} boundary={_wv20}")
+        for _v20 in range(40):
+            _srv20._warnings(dict(_cpu20, usage=float(_v20)), dict(_gpu20, usage=float(_v20 % 7)), _ram20,
+                             dict(_net20, download_kbps=_v20 * 1.5))
+        with _srv20._state_lock:
+            _drift20 = max(abs(_srv20._roll_sum['cpu'] - sum(_srv20._sustained['cpu'])),
+                           abs(_srv20._roll_sum['gpu'] - sum(_srv20._sustained['gpu'])),
+                           abs(_srv20._roll_sum['net'] - sum(_srv20._net_base)))
+            _nbok20 = _srv20._net_base.maxlen == _srv20._thresh['network']['baseline_samples']
+        if _drift20 < 1e-6 and _nbok20:
+            ok("server: rolling sums match deque contents after 40 ticks; _net_base sized to baseline_samples")
+        else:
+            fail(f"server: rolling sum drift={_drift20} net_base maxlen ok={_nbok20}")
+        _tc20s, _tj20s = _srv20._thresh_c, _srv20._thresh_json
+        _r20s = _srv20.app.test_client().post('/api/thresholds', json={'cpu': {'temp_warn': '80'}})
+        _g20s = (_srv20.app.test_client().get('/api/thresholds').get_json() or {}).get('cpu', {})
+        if (_r20s.status_code == 400 and _srv20._thresh_c == _tc20s and _srv20._thresh_json == _tj20s
+                and not isinstance(_g20s.get('temp_warn'), str)):
+            ok("server: non-numeric threshold POST -> 400, compiled and served thresholds untouched")
+        else:
+            fail(f"server: bad threshold POST status={_r20s.status_code} GET cpu={_g20s}")
+        # A hand-edited profile with a null leaf: that leaf falls back, the rest is honoured, alerts stay on
+        _bad20 = _copy20.deepcopy(_saved20); _bad20['cpu']['temp_warn'] = None; _bad20['cpu']['temp_crit'] = 88
+        with open(os.path.join(_td20th.name, 'thresholds.json'), 'w', encoding='utf-8') as _fh20th:
+            json.dump(_bad20, _fh20th)
+        _srv20._load_thresholds()
+        _g20b = (_srv20.app.test_client().get('/api/thresholds').get_json() or {}).get('cpu', {})
+        if (isinstance(_srv20._thresh_c, tuple) and _srv20._thresh_c[1] == 88
+                and isinstance(_g20b.get('temp_warn'), (int, float)) and _g20b.get('temp_crit') == 88):
+            ok("server: profile with a null threshold loads -- bad leaf defaulted, warnings and GET still live")
+        else:
+            fail(f"server: bad profile leaf broke thresholds: _thresh_c={_srv20._thresh_c!r} GET cpu={_g20b}")
+    finally:
+        _srv20.PROF_DIR = _prof20
+        _srv20._thresh = _saved20; _srv20._compile_thresholds()
+        _td20th.cleanup()
+except Exception as _e20th:
+    fail(f"§20 threshold compile error: {_e20th}")
+
+# -- server: /api/stats reuses a sample taken < STATS_MIN_INTERVAL ago ---------
+try:
+    import server as _srv20s
+    _c20s = _srv20s.app.test_client()
+    _srv20s._stats_cache = None
+    _a20s = _c20s.get('/api/stats').get_json(); _b20s = _c20s.get('/api/stats').get_json()
+    if _a20s and _b20s and _a20s.get('timestamp') == _b20s.get('timestamp'):
+        ok("server: back-to-back /api/stats share one cached sample (no duplicate psutil reads)")
+    else:
+        fail("server: back-to-back /api/stats re-sampled hardware instead of reusing the cache")
+    if _a20s and _a20s['cpu']['cores'] == _srv20s._CPU_CORES:
+        ok("server: cpu cores/threads served from startup constants")
+    else:
+        fail("server: cpu cores not taken from _CPU_CORES")
+except Exception as _e20s:
+    fail(f"§20 stats cache error: {_e20s}")
+
+# -- server: sensors_temperatures() throttled to SENSOR_TEMP_TTL ---------------
+try:
+    import server as _srv20t
+    _orig20t = getattr(_srv20t.psutil, 'sensors_temperatures', None)
+    _n20t = []
+    _srv20t.psutil.sensors_temperatures = lambda: (_n20t.append(1), {})[1]
+    try:
+        _srv20t._sensor_temp_cache.update(val=None, t=0.0)
+        for _ in range(3): _srv20t._hw_read_cpu()
+    finally:
+        if _orig20t is None: del _srv20t.psutil.sensors_temperatures
+        else: _srv20t.psutil.sensors_temperatures = _orig20t
+    if len(_n20t) == 1:
+        ok(f"server: 3 HW reads -> 1 sensors_temperatures() call (TTL {_srv20t.SENSOR_TEMP_TTL}s)")
+    else:
+        fail(f"server: sensors_temperatures() called {len(_n20t)}x in 3 reads -- TTL cache not applied")
+    if sys.platform != 'win32':
+        from collections import namedtuple as _nt20
+        _E20 = _nt20('shwtemp', 'label current high critical')
+        _fake20 = {'nvme': [_E20('Composite', 38.0, 80, 85)], 'w1_slave_temp': [_E20('', 21.0, None, None)],
+                   'k10temp': [_E20('Tctl', 61.5, None, None)]}
+        _srv20t.psutil.sensors_temperatures = lambda: _fake20
+        try:
+            _srv20t._sensor_temp_cache.update(val=None, t=0.0, key=None)
+            _tv20 = _srv20t._sensor_cpu_temp()
+        finally:
+            if _orig20t is None: del _srv20t.psutil.sensors_temperatures
+            else: _srv20t.psutil.sensors_temperatures = _orig20t
+            _srv20t._sensor_temp_cache.update(val=None, t=0.0)
+        if _tv20 == 61.5 and _srv20t._sensor_temp_cache['key'] == 'k10temp':
+            ok("server: CPU temp read from k10temp (nvme / 1-wire skipped) and sensor key pinned")
+        else:
+            fail(f"server: CPU sensor pick wrong: temp={_tv20} key={_srv20t._sensor_temp_cache['key']}")
+        _srv20t._sensor_temp_cache['key'] = None
+except Exception as _e20t:
+    fail(f"§20 sensor TTL error: {_e20t}")
+
+# -- server: session log written by the _log_writer thread, not the request ---
+try:
+    import server as _srv20l
+    _lf20 = os.path.join(_srv20l.LOG_DIR, f"session_{_srv20l.datetime.date.today().isoformat()}.jsonl")
+    _srv20l._flush_log()
+    _sz20 = os.path.getsize(_lf20) if os.path.exists(_lf20) else 0
+    _srv20l._log_stats(dict(timestamp=time.time(), cpu={}, ram={}, gpu={}, warnings=[]))
+    _inline20 = (os.path.getsize(_lf20) if os.path.exists(_lf20) else 0) != _sz20
+    _srv20l._log_wake.set()
+    _dl20 = time.time() + 5
+    while time.time() < _dl20 and (os.path.getsize(_lf20) if os.path.exists(_lf20) else 0) == _sz20:
+        time.sleep(0.02)
+    _flushed20 = (os.path.getsize(_lf20) if os.path.exists(_lf20) else 0) > _sz20
+    if not _inline20 and _flushed20:
+        ok("server: _log_stats() only buffers; _log_writer thread flushes the session log")
+    else:
+        fail(f"server: log flush path wrong (inline write={_inline20}, writer flushed={_flushed20})")
+except Exception as _e20l:
+    fail(f"§20 log writer error: {_e20l}")
+
+# -- server: feedback appends reuse one cached _append handle per category -----
+try:
+    import server as _srv20f, tempfile as _tf20f
+    _fbdir20, _fbgen20 = _srv20f.FEEDBACK_DIR, _srv20f._FB_FILES['general']
+    with _tf20f.TemporaryDirectory() as _td20f:
+        _srv20f.FEEDBACK_DIR = os.path.join(_td20f, 'feedback')   # not created: _append makes it
+        _ff20 = _srv20f._FB_FILES['general'] = os.path.join(_srv20f.FEEDBACK_DIR, 'general.jsonl')
+        try:
+            _c20f = _srv20f.app.test_client()
+            _r20f = [_c20f.post('/api/feedback', json={'category': 'general', 'message': f'T20 feedback {_m}'}).status_code
+                     for _m in ('a', 'b')]
+            _fd20f = _srv20f._append_fhs.get(_ff20)
+            with open(_ff20, encoding='utf-8') as _fh20:
+                _msgs20 = [json.loads(l)['message'] for l in _fh20 if l.strip()]
+            _lost20f = None
+            if sys.platform != 'win32':   # feedback dir cleared mid-session: the next report must still land
+                import shutil as _sh20f
+                _sh20f.rmtree(_srv20f.FEEDBACK_DIR)
+                _r20f.append(_c20f.post('/api/feedback', json={'category': 'general', 'message': 'T20 feedback c'}).status_code)
+                with open(_ff20, encoding='utf-8') as _fh20:
+                    _lost20f = [json.loads(l)['message'] for l in _fh20 if l.strip()] != ['T20 feedback c']
+        finally:
+            _srv20f.FEEDBACK_DIR, _srv20f._FB_FILES['general'] = _fbdir20, _fbgen20
+            with _srv20f._append_lock:
+                _h20f = _srv20f._append_fhs.pop(_ff20, None)
+            if _h20f is not None: _h20f.close()   # release before the temp dir is removed (Windows)
+    if (set(_r20f) == {200} and _fd20f is not None and _msgs20 == ['T20 feedback a', 'T20 feedback b']
+            and not _lost20f):
+        ok("server: feedback appended through the shared _append handle cache; survives a cleared feedback dir")
+    else:
+        fail(f"server: feedback append wrong (status={_r20f}, fd={_fd20f}, msgs={_msgs20}, lost after rmtree={_lost20f})")
+except Exception as _e20f:
+    fail(f"§20 feedback append error: {_e20f}")
+
+# -- server: rate-limit window is a bounded deque trimmed from the head -------
+try:
+    import server as _srv20r
+    _ip20r = '10.20.30.40'
+    with _srv20r._rl_lock:
+        _srv20r._rl[_ip20r] = _srv20r.deque([time.time() - 5] * _srv20r.RL_MAX, maxlen=_srv20r.RL_MAX)
+    _lim20r = _srv20r._rate_limited(_ip20r)
+    with _srv20r._rl_lock:
+        _w20r = _srv20r._rl.pop(_ip20r, None)
+    if not _lim20r and _w20r is not None and len(_w20r) == 1 and _w20r.maxlen == _srv20r.RL_MAX:
+        ok("server: expired rate-limit hits trimmed in place; per-IP window capped at RL_MAX")
+    else:
+        fail(f"server: rate-limit window wrong (limited={_lim20r}, window={_w20r})")
+    _saved20r, _cap20r = None, _srv20r.RL_IPS_MAX
+    with _srv20r._rl_lock:
+        _saved20r = _srv20r._rl.copy(); _srv20r._rl.clear()
+    try:
+        _srv20r.RL_IPS_MAX = 3
+        for _i20r in range(5): _srv20r._rate_limited(f'10.20.0.{_i20r}')
+        _srv20r._rate_limited('10.20.0.2')   # touch -> most recent
+        _srv20r._rate_limited('10.20.0.9')
+        _keys20r = list(_srv20r._rl)
+    finally:
+        _srv20r.RL_IPS_MAX = _cap20r
+        with _srv20r._rl_lock:
+            _srv20r._rl.clear(); _srv20r._rl.update(_saved20r)
+    if _keys20r == ['10.20.0.4', '10.20.0.2', '10.20.0.9']:
+        ok("server: rate-limit table capped at RL_IPS_MAX with least-recently-seen eviction")
+    else:
+        fail(f"server: rate-limit LRU wrong: {_keys20r}")
+except Exception as _e20r:
+    fail(f"§20 rate limit error: {_e20r}")
+
+# -- server: feedback queue re-parses a category file only when it changes ----
+try:
+    import server as _srv20q, tempfile as _tf20q
+    with _tf20q.TemporaryDirectory() as _td20q:
+        _fq20 = os.path.join(_td20q, 'bug.jsonl')
+        with open(_fq20, 'w', encoding='utf-8') as _fh20:
+            for _i20q, _st20q in enumerate(('open', 'fixed', 'open')):
+                _fh20.write(json.dumps({'id': _i20q, 'status': _st20q}) + '\n')
+        _a20q = _srv20q._fb_open_items(_fq20)
+        _b20q = _srv20q._fb_open_items(_fq20)
+        with open(_fq20, 'a', encoding='utf-8') as _fh20:
+            _fh20.write(json.dumps({'id': 3, 'status': 'open'}) + '\n')
+        _c20q = _srv20q._fb_open_items(_fq20)
+        _srv20q._fb_open_cache.pop(_fq20, None)
+        if [e['id'] for e in _a20q] == [0, 2] and _b20q is _a20q and [e['id'] for e in _c20q] == [0, 2, 3]:
+            ok("server: feedback queue cached per file; re-parsed only after the file changes")
+        else:
+            fail(f"server: feedback queue cache wrong: {_a20q} / {_c20q}")
+except Exception as _e20q:
+    fail(f"§20 feedback queue error: {_e20q}")
+
+# -- server: threshold payload validator (iterative walk) ----------------------
+try:
+    import server as _srv20v
+    _cases20v = [
+        ({'cpu': {'temp_warn': 80, 'temp_crit': 95.5}, 'name': 'x', 'on': True, 'n': None}, True),
+        ({'a': {'b': {'c': {'d': 1}}}}, False),          # depth 4
+        ({'cpu': {'temp_warn': 10001}}, False),          # out of range
+        ({'cpu': [1, 2]}, False),                        # lists not allowed
+        ({f'k{i}': 1 for i in range(21)}, False),        # too many keys
+        ({'k' * 51: 1}, False),                          # key too long
+        ({'s': 'x' * 101}, False),                       # string too long
+    ]
+    _bad20v = [c for c, want in _cases20v if _srv20v._validate(c)[0] is not want]
+    if not _bad20v:
+        ok(f"server: _validate accepts/rejects {len(_cases20v)} threshold payloads as expected")
+    else:
+        fail(f"server: _validate wrong for {_bad20v[0]!r:.80}")
+except Exception as _e20v:
+    fail(f"§20 validate error: {_e20v}")
+
+# -- server: CPU bench kernels agree; result records which kernel ran ---------
+try:
+    import server as _srv20b
+    _v20b, _p20b = _srv20b._bench_worker_fn(50_000), _srv20b._bench_worker_fn(50_000, python=True)
+    _st20b = _srv20b.bench_cpu_st(n=20_000)
+    if abs(_v20b - _p20b) <= 1e-9 * abs(_p20b) and _st20b.get('kernel') == _srv20b._bench_kernel():
+        ok(f"server: CPU bench kernel '{_st20b['kernel']}' matches the interpreter loop; kernel recorded in result")
+    else:
+        fail(f"server: bench kernels disagree ({_v20b} vs {_p20b}) or kernel missing: {_st20b}")
+except Exception as _e20b:
+    fail(f"§20 bench kernel error: {_e20b}")
+
+# -- server: _log_err batches through one writer thread (no thread per error) --
+try:
+    import server as _srv20e
+    _n20e = threading.active_count()
+    _tag20e = f'test:batch:{time.time()}'
+    for _i20e in range(20): _srv20e._log_err(_tag20e, ValueError(f'e{_i20e}'))
+    _grew20e = threading.active_count() - _n20e
+    _srv20e._flush_errs()
+    _dl20e = time.time() + 3   # the writer thread may be mid-flush of part of the batch
+    while True:
+        with open(os.path.join(_srv20e.LOG_DIR, 'errors.jsonl'), encoding='utf-8') as _fh20:
+            _got20e = sum(1 for l in _fh20 if _tag20e in l)
+        if _got20e == 20 or time.time() > _dl20e: break
+        time.sleep(0.05)
+    if _grew20e <= 0 and _got20e == 20:
+        ok("server: 20 errors logged via _err_writer batching without spawning a thread each")
+    else:
+        fail(f"server: _log_err spawned {_grew20e} thread(s) / {_got20e} of 20 entries written")
+except Exception as _e20e:
+    fail(f"§20 error batching error: {_e20e}")
+
+# -- server: feedback dedup expires/caps from the front of an ordered dict -----
+try:
+    import server as _srv20d
+    with _srv20d._fb_lock:
+        _saved20d = _srv20d._fb_dedup.copy(); _srv20d._fb_dedup.clear()
+        _srv20d._fb_dedup[('bug', 'stale')] = time.time() - 2 * _srv20d.FB_DEDUP_WIN
+    _cap20d = _srv20d.FB_DEDUP_MAX
+    try:
+        _srv20d.FB_DEDUP_MAX = 3
+        _dup20d = [_srv20d._fb_duplicate('bug', m) for m in ('a', 'b', 'A ', 'c', 'd')]
+        _keys20d = [k[1] for k in _srv20d._fb_dedup]
+    finally:
+        _srv20d.FB_DEDUP_MAX = _cap20d
+        with _srv20d._fb_lock:
+            _srv20d._fb_dedup.clear(); _srv20d._fb_dedup.update(_saved20d)
+    if _dup20d == [False, False, True, False, False] and _keys20d == ['b', 'c', 'd']:
+        ok("server: feedback dedup drops expired entries and caps size from the oldest end")
+    else:
+        fail(f"server: feedback dedup wrong: dup={_dup20d} keys={_keys20d}")
+except Exception as _e20d:
+    fail(f"§20 feedback dedup error: {_e20d}")
+
+# -- server: bench_disk syncs writes and reads into a reused buffer ------------
+try:
+    import server as _srv20k
+    _dk20 = _srv20k.bench_disk(size_mb=8)
+    _left20k = [f for f in os.listdir(_srv20k.DATA_DIR) if f.startswith('_bench_')]
+    if 'error' not in _dk20 and _dk20['write_mbps'] > 0 and _dk20['read_mbps'] > 0 and not _left20k:
+        ok(f"server: bench_disk {_dk20['write_mbps']}/{_dk20['read_mbps']} MB/s (uncached={_dk20['uncached']}), temp file removed")
+    else:
+        fail(f"server: bench_disk failed: {_dk20} leftover={_left20k}")
+except Exception as _e20k:
+    fail(f"§20 bench_disk error: {_e20k}")
+
+# -- server: _guard refuses remote POSTs before touching the rate-limit table --
+try:
+    import server as _srv20g
+    _c20g = _srv20g.app.test_client()
+    _ip20g = '10.20.30.40'
+    with _srv20g._rl_lock: _srv20g._rl.pop(_ip20g, None)
+    _n20g = len(_srv20g._rl)
+    _lr20g = _c20g.get('/api/version', environ_base={'REMOTE_ADDR': '127.0.0.1'})
+    _pr20g = _c20g.post('/api/thresholds', json={'cpu': {'temp_warn': 75}}, environ_base={'REMOTE_ADDR': _ip20g})
+    if _lr20g.status_code == 200 and _pr20g.status_code == 403 and len(_srv20g._rl) == _n20g:
+        ok("server: localhost and refused remote POSTs bypass the rate-limit table")
+    else:
+        fail(f"server: _guard local={_lr20g.status_code} post={_pr20g.status_code} rl {_n20g}->{len(_srv20g._rl)}")
+except Exception as _e20g:
+    fail(f"§20 guard fast-path error: {_e20g}")
+
+# -- server: _append reuses one handle per JSONL path -------------------------
+try:
+    import server as _srv20a, tempfile as _tf20a
+    with _tf20a.TemporaryDirectory() as _td20a:
+        _p20a = os.path.join(_td20a, 'a.jsonl')
+        _srv20a._append(_p20a, b'{"n":1}\n'); _h20a = _srv20a._append_fhs.get(_p20a)
+        _srv20a._append(_p20a, b'{"n":2}\n')
+        with open(_p20a, encoding='utf-8') as _fh20a: _rows20a = [json.loads(l)['n'] for l in _fh20a]
+        _same20a = _h20a is not None and _srv20a._append_fhs.get(_p20a) is _h20a
+        with _srv20a._append_lock: _srv20a._append_fhs.pop(_p20a).close()
+        if _same20a and _rows20a == [1, 2]:
+            ok("server: _append writes through one cached handle per path")
+        else:
+            fail(f"server: _append reopened the file or lost rows: same={_same20a} rows={_rows20a}")
+except Exception as _e20a:
+    fail(f"§20 append handle cache error: {_e20a}")
+
+# -- server: _append reopens a file deleted out from under its cached handle ---
+if sys.platform != 'win32':   # Windows refuses to delete a file that is still open
+    try:
+        import server as _srv20x, tempfile as _tf20x, shutil as _sh20x
+        with _tf20x.TemporaryDirectory() as _td20x:
+            _p20x = os.path.join(_td20x, 'logs', 'errors.jsonl')
+            try:
+                _srv20x._append(_p20x, b'{"n":1}\n')
+                _sh20x.rmtree(os.path.dirname(_p20x))   # logs/ cleared while the handle is cached
+                _srv20x._append(_p20x, b'{"n":2}\n')
+                with open(_p20x, encoding='utf-8') as _fh20x: _rows20x = [json.loads(l)['n'] for l in _fh20x]
+            finally:
+                with _srv20x._append_lock:
+                    _h20x = _srv20x._append_fhs.pop(_p20x, None)
+                if _h20x is not None: _h20x.close()
+        if _rows20x == [2]:
+            ok("server: _append notices an unlinked file (st_nlink == 0) and recreates it -- no writes lost")
+        else:
+            fail(f"server: _append wrote into a deleted file: rows on disk={_rows20x}")
+    except Exception as _e20x:
+        fail(f"§20 append reopen error: {_e20x}")
+
+# -- server: _jsonl_tail parses only appended bytes ----------------------------
+try:
+    import server as _srv20t2, tempfile as _tf20t2
+    with _tf20t2.TemporaryDirectory() as _td20t2:
+        _p20t2 = os.path.join(_td20t2, 'errors.jsonl')
+        with open(_p20t2, 'wb') as _fh20t2: _fh20t2.write(b''.join(b'{"n":%d}\n' % i for i in range(30)))
+        _a20t2 = _srv20t2._jsonl_tail(_p20t2)
+        with open(_p20t2, 'ab') as _fh20t2: _fh20t2.write(b'{"n":30}\nnot json\n{"n":3')   # bad + half-written line
+        _b20t2 = _srv20t2._jsonl_tail(_p20t2)
+        with open(_p20t2, 'ab') as _fh20t2: _fh20t2.write(b'1}\n')
+        _c20t2 = _srv20t2._jsonl_tail(_p20t2)
+        with open(_p20t2, 'wb') as _fh20t2: _fh20t2.write(b'{"n":99}\n')               # cleared + rewritten
+        _d20t2 = _srv20t2._jsonl_tail(_p20t2)
+        _srv20t2._tail_cache.pop(_p20t2, None)
+        if (_a20t2[0] == 30 and _a20t2[1] == {'n': 0} and [e['n'] for e in _a20t2[2]] == list(range(10, 30))
+                and _b20t2[0] == 31 and _c20t2[0] == 32 and _c20t2[2][-1] == {'n': 31}
+                and _d20t2[0] == 1 and _d20t2[1] == {'n': 99}):
+            ok("server: _jsonl_tail counts/keeps tail incrementally, waits on partial lines, resets on truncate")
+        else:
+            fail(f"server: _jsonl_tail wrong: {_a20t2[:2]} {_b20t2[0]} {_c20t2[0]} {_d20t2[:2]}")
+except Exception as _e20t2:
+    fail(f"§20 jsonl tail error: {_e20t2}")
+
+# -- server: _cpu_freq_fast gives a sane average clock -------------------------
+try:
+    import server as _srv20q
+    _f20q = _srv20q._cpu_freq_fast()
+    if _f20q is None or 0.1 < _f20q < 10:
+        ok(f"server: _cpu_freq_fast -> {_f20q} GHz ({'/proc/cpuinfo' if _srv20q._cpuinfo_ok else 'psutil'})")
+    else:
+        fail(f"server: _cpu_freq_fast returned implausible {_f20q!r}")
+except Exception as _e20q2:
+    fail(f"§20 cpu freq error: {_e20q2}")
+
+# -- server: feedback queue returns the most urgent items first ---------------
+try:
+    import server as _srv20u, tempfile as _tf20u
+    _saved20u = {c: _srv20u._FB_FILES[c] for c in _srv20u._FB_CATS}
+    with _tf20u.TemporaryDirectory() as _d20u:
+        _spec20u = {'bug': ['critical'] * 30 + ['high'] * 30, 'performance': ['normal'] * 5, 'general': ['low'] * 40}
+        for _c20u, _ps20u in _spec20u.items():
+            _srv20u._FB_FILES[_c20u] = os.path.join(_d20u, f'{_c20u}.jsonl')
+            with open(_srv20u._FB_FILES[_c20u], 'w', encoding='utf-8') as _fh20u:
+                for _i20u, _p20u in enumerate(reversed(_ps20u)):
+                    _fh20u.write(json.dumps({'id': f'{_c20u}-{_i20u}', 'priority': _p20u, 'status': 'open'}) + '\n')
+        _srv20u._FB_FILES['feature'] = os.path.join(_d20u, 'feature.jsonl')   # missing -> skipped
+        try:
+            _q20u = _srv20u.app.test_client().get('/api/feedback/queue').get_json()
+        finally:
+            _srv20u._FB_FILES.update(_saved20u)
+        _pr20u = [e['priority'] for e in _q20u['items']]
+        if _pr20u == ['critical'] * 30 + ['high'] * 20 and _q20u['counts'] == {'bug': 60, 'performance': 5, 'feature': 0, 'general': 40}:
+            ok("server: /api/feedback/queue returns the 50 most urgent open items across categories")
+        else:
+            fail(f"server: feedback queue order wrong: {_pr20u[:3]}..{_pr20u[-3:]} counts={_q20u['counts']}")
+except Exception as _e20u:
+    fail(f"§20 feedback queue merge error: {_e20u}")
+
+# -- server: /api/stats?since= returns only newer history points --------------
+try:
+    import server as _srv20s
+    _c20s = _srv20s.app.test_client()
+    _full20s = _c20s.get('/api/stats').get_json()
+    _ts20s = _full20s['history']['timestamps']
+    _s20s = _srv20s._stats_cache[0]
+    _h20s = dict(_s20s['history'], timestamps=[100, 101, 102, 103])
+    _fake20s = dict(_s20s, history={k: ([1, 2, 3, 4] if k != 'timestamps' else v) for k, v in _h20s.items()})
+    _d20s = _srv20s._stats_delta(_fake20s, 101)
+    _old20s = _srv20s._stats_delta(_fake20s, 5)
+    _fwd20s = _srv20s._stats_delta(_fake20s, 999)
+    _live20s = _c20s.get(f'/api/stats?since={_ts20s[-1]}').get_json() if _ts20s else None
+    if (_d20s['history']['timestamps'] == [102, 103] and _d20s['history']['cpu_usage'] == [3, 4]
+            and _d20s['history_start'] == 100 and len(_old20s['history']['timestamps']) == 4
+            and 'history_start' not in _fwd20s and 'history_start' not in _full20s
+            and (_live20s is None or ('cpu' in _live20s and all(t > _ts20s[-1] for t in _live20s['history']['timestamps'])))):
+        ok("server: /api/stats?since= sends only newer history points plus history_start")
+    else:
+        fail(f"server: stats delta wrong: {_d20s['history']['timestamps']} start={_d20s.get('history_start')}")
+except Exception as _e20s:
+    fail(f"§20 stats delta error: {_e20s}")
+
+# -- server: session log reopened when logs/ is removed mid-session -----------
+if sys.platform != 'win32':   # Windows refuses to delete a file that is still open
+    try:
+        import server as _srv20n, tempfile as _tf20n, shutil as _sh20n
+        _ld20n = _srv20n.LOG_DIR
+        with _tf20n.TemporaryDirectory() as _td20n:
+            with _srv20n._session_lock:
+                _srv20n._session_close(); _srv20n.LOG_DIR = os.path.join(_td20n, 'logs')
+            try:
+                _sf20n = os.path.join(_srv20n.LOG_DIR, f"session_{_srv20n.datetime.date.today().isoformat()}.jsonl")
+                _srv20n._log_stats(dict(timestamp=1.0, cpu={}, ram={}, gpu={}, warnings=[])); _srv20n._flush_log()
+                _sh20n.rmtree(_srv20n.LOG_DIR)
+                _srv20n._log_stats(dict(timestamp=2.0, cpu={}, ram={}, gpu={}, warnings=[])); _srv20n._flush_log()
+                with open(_sf20n, encoding='utf-8') as _fh20n:
+                    _ts20n = [json.loads(l)['ts'] for l in _fh20n if l.strip()]
+            finally:
+                with _srv20n._session_lock:
+                    _srv20n._session_close(); _srv20n.LOG_DIR = _ld20n
+        if _ts20n == [2.0]:
+            ok("server: deleted session log detected (st_nlink == 0) -- next flush recreates logs/ and the file")
+        else:
+            fail(f"server: session log not reopened after deletion: {_ts20n}")
+    except Exception as _e20n:
+        fail(f"§20 session log reopen error: {_e20n}")
+
+# -- server: old session logs are gzipped, today's is left for appends --------
+try:
+    import server as _srv20z, gzip as _gz20z
+    os.makedirs(_srv20z.LOG_DIR, exist_ok=True)
+    _old20z = os.path.join(_srv20z.LOG_DIR, 'session_2000-01-01.jsonl')
+    _new20z = os.path.join(_srv20z.LOG_DIR, f"session_{_srv20z.datetime.date.today().isoformat()}.jsonl")
+    _body20z = b''.join(b'{"cpu":{"usage":%d}}\n' % i for i in range(500))
+    with open(_old20z, 'wb') as _fh20z: _fh20z.write(_body20z)
+    with open(_new20z, 'ab') as _fh20z: pass
+    _srv20z._compress_old_sessions()
+    with _gz20z.open(_old20z + '.gz', 'rb') as _fh20z: _back20z = _fh20z.read()
+    _gzsz20z = os.path.getsize(_old20z + '.gz')
+    os.remove(_old20z + '.gz')
+    if _back20z == _body20z and not os.path.exists(_old20z) and os.path.exists(_new20z):
+        ok(f"server: past session log gzipped ({len(_body20z)} -> {_gzsz20z} bytes); today's untouched")
+    else:
+        fail(f"server: session compression wrong: roundtrip={_back20z == _body20z} old_left={os.path.exists(_old20z)}")
+except Exception as _e20z:
+    fail(f"§20 session compression error: {_e20z}")
+
+# -- launch.py: shutdown watchdog probes a cheap endpoint, not /api/stats ------
+try:
+    with open(os.path.join(_root20, 'launch.py'), encoding='utf-8') as _f:
+        _wd20 = _f.read().split('def watch_for_shutdown', 1)[1].split('\ndef ', 1)[0]
+    if '/api/version' in _wd20 and '/api/stats' not in _wd20.split('"""')[-1]:
+        ok("launch.py: watchdog polls /api/version -- an idle server lets _gpu_worker sleep")
+    else:
+        fail("launch.py: watchdog still polls /api/stats -- keeps sampling hardware with no dashboard open")
+except Exception as _e20wd:
+    fail(f"§20 launch watchdog error: {_e20wd}")
+
 # -- Write HTML report ---------------------------------------------------------
 from datetime import datetime
 now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')